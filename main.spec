@@ -5,7 +5,7 @@ a = Analysis(
     ['c:\\code\\AltiumXCEL2QueryBuilder\\src\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('resources/style.qss', 'resources')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
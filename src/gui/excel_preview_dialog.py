@@ -168,6 +168,7 @@ class ExcelPreviewDialog(QDialog):
         self.end_row = 11 # -1 means no end row limit
         self.use_first_row_as_header = False # Default changed to False
         self.use_first_column_as_index = True
+        self.current_processed_df: Optional[pd.DataFrame] = None # Set by _load_data
         
         self.setWindowTitle(f"Preview Excel File - {sheet_name}")
         self.resize(800, 600)
@@ -359,7 +360,7 @@ class ExcelPreviewDialog(QDialog):
     def get_processed_dataframe(self) -> pd.DataFrame:
         """Return the final processed dataframe after preview and potential modifications"""
         # Ensure the latest state of the dataframe (after potential variable replacement) is returned
-        return self.current_processed_df.copy() if hasattr(self, 'current_processed_df') and self.current_processed_df is not None else pd.DataFrame()
+        return self.current_processed_df.copy() if self.current_processed_df is not None else pd.DataFrame()
 
     def get_import_options(self) -> Dict[str, Any]:
         """Return the selected import options"""
@@ -13,32 +13,78 @@ import os
 import sys
 import logging
 import re # Import re for regex matching
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime # Import datetime
 from typing import List, Optional # For type hinting
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QAction, QFileDialog,
                              QMenu, QToolBar, QStatusBar, QMessageBox,
                              QDockWidget, QVBoxLayout, QHBoxLayout, QWidget,
-                             QShortcut, QApplication, QInputDialog, QActionGroup)
-from PyQt5.QtGui import QFont, QIcon, QKeySequence
-from PyQt5.QtCore import Qt, QSize, pyqtSignal
+                             QApplication, QInputDialog, QActionGroup,
+                             QProgressDialog, QLabel)
+from PyQt5.QtGui import QIcon, QKeySequence
+from PyQt5.QtCore import Qt, QSize, QByteArray, QThreadPool, QTimer, pyqtSignal
 
-from models.excel_data import ExcelPivotData
 from models.rule_model import RuleType, UnitType, BaseRule # Import BaseRule
 # Import RuleManager directly
 from models.rule_model import RuleManager
 
-from gui.preferences_dialog import PreferencesDialog # Add import for PreferencesDialog
-# Import RulesManagerWidget instead of RuleEditorWidget
-from gui.rule_editor_widget import RulesManagerWidget
-from services.rule_generator import RuleGenerator, RuleGeneratorError # Add import for RuleGenerator
+from gui.worker import Worker
+from utils.atomic_file import atomic_open
+from services.rule_generator import RuleGeneratorError
+
+# Widgets, dialogs and services that pull in pandas are imported where they are first used,
+# so the window can paint before an Excel file is ever opened
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; resources/icons ships with the repo, so no existence check is needed
+_ICONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "resources", "icons")
+
+@lru_cache(maxsize=64)
+def _load_icon(icon_path):
+    """Load a QIcon once per path; shared by menus, toolbar and every window."""
+    return QIcon(icon_path)
+
+# Skip per-directory icon lookups and symlink resolution, which stat every entry (slow on network shares)
+_FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
 class MainWindow(QMainWindow):
     """Main application window"""
     # Signal emitted when a tab's data changes significantly enough to warrant a save prompt
     unsaved_changes_changed = pyqtSignal(bool)
 
+    # Menu and toolbar actions: (text, icon file, shortcut, tooltip, callback method name)
+    _IMPORT_MENU_ACTIONS = (
+        ("Import Excel File", "excel.png", "Ctrl+I", "Import data from Excel file (Ctrl+I)", "_import_excel"),
+        ("Import RUL File", "rul.png", "Ctrl+R", "Import data from Altium RUL file (Ctrl+R)", "_import_rul"),
+    )
+    _EXPORT_MENU_ACTIONS = (
+        ("Export to Excel", "excel.png", "Ctrl+E", "Export data to Excel file (Ctrl+E)", "_export_excel"),
+        ("Export RUL File", "rul.png", "Ctrl+S", "Export data to Altium RUL file (Ctrl+S)", "_export_rul_in_background"),
+    )
+    _FILE_MENU_ACTIONS = (
+        ("E&xit", "exit.png", "Alt+F4", "Exit the application (Alt+F4)", "close"),
+    )
+    _EDIT_MENU_ACTIONS = (
+        ("&Preferences", "settings.png", "Ctrl+P", "Open application preferences (Ctrl+P)", "_show_preferences"),
+    )
+    _VIEW_MENU_ACTIONS = (
+        ("Show &Rule Manager", "settings.png", None, "Open the Rule Manager tab", "_show_rule_editor_tab"),
+    )
+    _HELP_MENU_ACTIONS = (
+        ("&About", "about.png", None, "Show information about the application", "_show_about"),
+    )
+    _SHORTCUT_ACTIONS = (
+        ("Next Tab", None, "Ctrl+Tab", "Switch to the next tab (Ctrl+Tab)", "_next_tab"),
+        ("Previous Tab", None, "Ctrl+Shift+Tab", "Switch to the previous tab (Ctrl+Shift+Tab)", "_prev_tab"),
+    )
+    _TOOLBAR_ACTIONS = (
+        ("Import Excel", "excel_import.png", "Ctrl+I", "Import data from Excel file (Ctrl+I)", "_import_excel"),
+        ("Import RUL", "rul_import.png", "Ctrl+R", "Import data from Altium RUL file (Ctrl+R)", "_import_rul"),
+    )
+
     def __init__(self, config_manager, theme_manager, parent=None):
         """Initialize the main window"""
         super().__init__(parent)
@@ -48,33 +94,21 @@ class MainWindow(QMainWindow):
         self.pivot_tab = None
         # Rename instance variable
         self.rules_manager_tab = None
-
-        # Set default font for the application
-        default_font = QFont("Arial", 10)
-        QApplication.setFont(default_font)
-
-        # Ensure button text is visible
-        # self.setStyleSheet("QPushButton { text-align: center; }") # Remove or comment out if theme handles this
-
-        # Apply base stylesheet including menu padding
-        self.setStyleSheet("""
-            QPushButton { 
-                text-align: center; 
-            }
-            QMenu::item {
-                padding: 5px 30px 5px 20px; /* Increased right padding (Top, Right, Bottom, Left) */
-            }
-            QMenuBar::item {
-                padding: 5px 10px; /* Adjust spacing for top-level menu bar items */
-            }
-        """)
+        self._excel_import_context = None # State of the Excel import in progress, None when idle
+        self._import_progress = None # Modal busy dialog shown while an import step runs in the background
+        self._rul_import_path = None # File being parsed while a RUL import runs in the background
+        self._unsaved_check_scheduled = False # True while a _check_unsaved_changes run is queued
+        self._dirty_tabs = set() # Tabs that reported unsaved changes via unsaved_changes_changed
+        self._title_shows_unsaved = False # Whether the window title currently ends with the unsaved "*"
+        self._export_context = None # Destination path while an export runs in the background
+        self._export_on_saved = None # Called after the running background export succeeds
+        self._pivot_signals_connected = False # True while the pivot tab's signals are connected to this window
+        self._last_pivot_hash = None # Fingerprint of the last imported DataFrame, cleared once the pivot is edited
+
+        # Button alignment and menu padding come from resources/style.qss, applied with the theme
 
         # Set up icons path
-        self.icons_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                                      "resources", "icons")
-        if not os.path.exists(self.icons_path):
-            os.makedirs(self.icons_path, exist_ok=True)
-            logger.info(f"Created icons directory at {self.icons_path}")
+        self.icons_path = _ICONS_PATH
 
         self.setWindowTitle("Altium Rule Generator")
         self.setMinimumSize(1200, 800)
@@ -94,7 +128,20 @@ class MainWindow(QMainWindow):
         self.tab_widget.setTabsClosable(True) # Make tabs closable
         self.tab_widget.tabCloseRequested.connect(self._close_tab) # Connect close signal
         self.setCentralWidget(self.tab_widget)
-        
+
+        # Start with cheap placeholder tabs; the real widgets are built on first visit
+        self._placeholder_tabs = {} # placeholder QWidget -> tab kind
+        self._tab_factories = {
+            "pivot": self._create_pivot_tab,
+            "rules": self._create_rules_manager_tab,
+        }
+        self._add_placeholder_tab("pivot", "Pivot Table")
+        self._add_placeholder_tab("rules", "Rule Manager")
+        # Connected after the placeholders so adding them does not build anything
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        # The first placeholder became current while the signal was not connected yet
+        self._materialize_tab(self.tab_widget.currentIndex())
+
         # Create UI components
         self._create_menus()
         self._create_toolbar()
@@ -102,7 +149,13 @@ class MainWindow(QMainWindow):
         # Create status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready", 5000)
+        # Messages go to a label; in Qt 5 QStatusBar.showMessage repaints synchronously on every call
+        self._status_label = QLabel()
+        self.status_bar.addWidget(self._status_label, 1)
+        self._status_clear_timer = QTimer(self)
+        self._status_clear_timer.setSingleShot(True)
+        self._status_clear_timer.timeout.connect(self._status_label.clear)
+        self._show_status("Ready", 5000)
         
         # Remove automatic tab adding
         # self._add_tabs()
@@ -110,15 +163,142 @@ class MainWindow(QMainWindow):
         # Set up additional keyboard shortcuts
         self._setup_shortcuts()
 
-    def _close_tab(self, index):
-        """Close the tab at the given index."""
+    @contextmanager
+    def _tabbar_frozen(self):
+        """Suspend tab bar repaints and relayouts while tabs are added or removed."""
+        bar = self.tab_widget.tabBar()
+        if not bar.updatesEnabled():
+            yield # Already frozen by an outer caller
+            return
+        bar.setUpdatesEnabled(False)
+        bar.setVisible(False)
+        try:
+            yield
+        finally:
+            bar.setVisible(True)
+            bar.setUpdatesEnabled(True)
+
+    def _close_all_tabs(self):
+        """Close every tab without prompting, last to first so no remaining tab is shifted."""
+        # Block signals so closing a tab does not materialize the placeholder next to it
+        self.tab_widget.blockSignals(True)
+        try:
+            with self._tabbar_frozen():
+                for index in reversed(range(self.tab_widget.count())):
+                    self._close_tab(index, prompt=False)
+        finally:
+            self.tab_widget.blockSignals(False)
+
+    def _add_placeholder_tab(self, kind, title):
+        """Add an empty placeholder tab that is replaced by the real widget on first visit."""
+        placeholder = QWidget()
+        self._placeholder_tabs[placeholder] = kind
+        return self.tab_widget.addTab(placeholder, title)
+
+    def _placeholder_index(self, kind):
+        """Return the tab index of the placeholder for the given kind, or -1 if there is none."""
+        for placeholder, placeholder_kind in self._placeholder_tabs.items():
+            if placeholder_kind == kind:
+                return self.tab_widget.indexOf(placeholder)
+        return -1
+
+    def _replace_placeholder(self, index, widget):
+        """Swap the placeholder at the given index for the real widget."""
+        placeholder = self.tab_widget.widget(index)
+        self._placeholder_tabs.pop(placeholder, None)
+        title = self.tab_widget.tabText(index)
+        # Block signals so the swap does not re-enter _materialize_tab
+        self.tab_widget.blockSignals(True)
+        try:
+            with self._tabbar_frozen():
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, widget, title)
+                self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _materialize_tab(self, index):
+        """Build the real widget for a placeholder tab the first time it becomes current."""
+        kind = self._placeholder_tabs.get(self.tab_widget.widget(index))
+        if kind is None:
+            return # Not a placeholder (or no tab at all)
+
+        try:
+            self._replace_placeholder(index, self._tab_factories[kind]())
+            logger.info(f"Materialized '{kind}' tab at index {index}.")
+        except Exception as e:
+            logger.error(f"Failed to create '{kind}' tab: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Could not create the tab: {e}")
+
+    def _show_status(self, message, timeout=0):
+        """Show a status bar message, cleared after timeout ms unless timeout is 0."""
+        self._status_label.setText(message)
+        if timeout > 0:
+            self._status_clear_timer.start(timeout) # Restarting drops the previous message's clear
+        else:
+            self._status_clear_timer.stop()
+
+    def _show_success(self, title, message):
+        """Confirm a finished import or export in a popup, if enabled; the status bar already reports it."""
+        if self.config.get("show_success_popups", False):
+            QMessageBox.information(self, title, message)
+
+    def _create_pivot_tab(self):
+        """Create the Pivot Table widget and connect its signals."""
+        from gui.pivot_table_widget import PivotTableWidget
+        pivot_tab = PivotTableWidget()
+        # Connect signals
+        if pivot_tab.model is not None:
+            pivot_tab.model.data_changed.connect(self._on_data_changed, Qt.QueuedConnection)
+        else:
+            logger.warning("PivotTableWidget created without a model, cannot connect data_changed signal.")
+        # Cross-tab signals are queued so the slots run from the event loop, not inside the emitter
+        pivot_tab.rules_generated.connect(self._handle_generated_rules, Qt.QueuedConnection)
+        pivot_tab.unsaved_changes_changed.connect(self._on_tab_unsaved_changes_changed)
+        self._pivot_signals_connected = True
+
+        self.pivot_tab = pivot_tab
+        logger.info("Pivot Table tab created.")
+        return pivot_tab
+
+    def _create_rules_manager_tab(self):
+        """Create the Rule Manager widget and connect its signals."""
+        from gui.rule_editor_widget import RulesManagerWidget
+        rules_manager_tab = RulesManagerWidget(self) # Pass self as parent
+        rules_manager_tab.unsaved_changes_changed.connect(self._on_tab_unsaved_changes_changed)
+
+        self.rules_manager_tab = rules_manager_tab
+        logger.info("Rule Manager tab created.")
+        return rules_manager_tab
+
+    def _tab_has_unsaved_changes(self, widget):
+        """Return True if widget is a tab that has reported unsaved changes."""
+        return widget in self._dirty_tabs
+
+    def _on_tab_unsaved_changes_changed(self, changed):
+        """Track which tabs have unsaved changes as they report them."""
+        widget = self.sender()
+        if changed:
+            self._dirty_tabs.add(widget)
+        else:
+            self._dirty_tabs.discard(widget)
+        self._check_unsaved_changes()
+
+    def _close_tab(self, index, prompt=True):
+        """Close the tab at the given index.
+
+        Args:
+            index (int): Index of the tab to close.
+            prompt (bool): Ask to save unsaved changes first. Pass False when the
+                           user has already answered a window-wide prompt.
+        """
         widget = self.tab_widget.widget(index)
         if widget:
             # Check if the widget being closed has unsaved changes
             prompt_save = False
             tab_name = self.tab_widget.tabText(index)
-            # Check if RulesManagerWidget implements has_unsaved_changes
-            if hasattr(widget, 'has_unsaved_changes') and widget.has_unsaved_changes():
+            if prompt and self._tab_has_unsaved_changes(widget):
                 reply = QMessageBox.question(self, f'Unsaved Changes in {tab_name}',
                                              f'The tab "{tab_name}" has unsaved changes. Do you want to save them before closing?',
                                              QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
@@ -128,9 +308,9 @@ class MainWindow(QMainWindow):
                     # Attempt to save based on tab type
                     save_successful = False
                     # Use renamed variable
-                    if widget == self.rules_manager_tab:
+                    if widget is self.rules_manager_tab:
                         save_successful = self._export_rul() # Returns True on success/cancel, False on failure
-                    elif widget == self.pivot_tab:
+                    elif widget is self.pivot_tab:
                         # Decide what saving means for pivot table (e.g., export Excel?)
                         # save_successful = self._export_excel() # Example
                         QMessageBox.information(self, "Save Pivot Table", "Saving the Pivot Table directly is not implemented. You can export it manually.")
@@ -148,45 +328,37 @@ class MainWindow(QMainWindow):
             # --- Proceed with closing the tab ---
 
             # Disconnect signals
-            if widget == self.pivot_tab:
-                try:
-                    if hasattr(self.pivot_tab, 'model') and self.pivot_tab.model:
-                         self.pivot_tab.model.data_changed.disconnect(self._on_data_changed)
-                    # Disconnect rules_generated signal
-                    if hasattr(self.pivot_tab, 'rules_generated'):
-                        self.pivot_tab.rules_generated.disconnect(self._handle_generated_rules)
-                except TypeError: # Signal already disconnected
-                    pass
+            self._dirty_tabs.discard(widget)
+            if widget in self._placeholder_tabs:
+                del self._placeholder_tabs[widget] # Never materialized, nothing to disconnect
+            elif widget is self.pivot_tab:
+                if self._pivot_signals_connected:
+                    if self.pivot_tab.model is not None:
+                        self.pivot_tab.model.data_changed.disconnect(self._on_data_changed)
+                    self.pivot_tab.rules_generated.disconnect(self._handle_generated_rules)
+                    self._pivot_signals_connected = False
                 self.pivot_tab = None
+                self._last_pivot_hash = None
                 logger.info("Pivot Table tab closed.")
             # Use renamed variable
-            elif widget == self.rules_manager_tab:
-                try:
-                    # Use correct signal name from RulesManagerWidget
-                    self.rules_manager_tab.rules_updated.disconnect(self._on_data_changed)
-                    # Remove disconnection for non-existent signal
-                    # self.rules_manager_tab.pivot_data_updated.disconnect(self._on_rule_pivot_updated)
-                except TypeError:
-                    pass
+            elif widget is self.rules_manager_tab:
+                # rules_updated is never connected here; deleteLater drops the remaining connections
                 # Use renamed variable
                 self.rules_manager_tab = None
                 logger.info("Rule Manager tab closed.")
 
             # Remove the tab
-            self.tab_widget.removeTab(index)
-            widget.deleteLater() # Ensure the widget is properly deleted
+            with self._tabbar_frozen():
+                self.tab_widget.removeTab(index)
+                widget.deleteLater() # Ensure the widget is properly deleted
             logger.info(f"Closed tab: {tab_name}")
             # Update overall unsaved changes status after closing a tab
             self._check_unsaved_changes()
 
     def _setup_shortcuts(self):
         """Set up additional keyboard shortcuts beyond those in menus/toolbars"""
-        # Tab navigation shortcuts
-        next_tab_shortcut = QShortcut(QKeySequence("Ctrl+Tab"), self)
-        next_tab_shortcut.activated.connect(self._next_tab)
-        
-        prev_tab_shortcut = QShortcut(QKeySequence("Ctrl+Shift+Tab"), self)
-        prev_tab_shortcut.activated.connect(self._prev_tab)
+        # Tab navigation shortcuts, as window-level actions dispatched by Qt's action handling
+        self._add_actions(self, self._SHORTCUT_ACTIONS)
     
     def _next_tab(self):
         """Switch to the next tab"""
@@ -217,50 +389,37 @@ class MainWindow(QMainWindow):
         
         # Import submenu
         import_menu = QMenu("&Import", self)
-        import_menu.setIcon(QIcon(os.path.join(self.icons_path, "import.png")))
+        import_menu.setIcon(self._icon("import.png"))
         self.file_menu.addMenu(import_menu)
         
         # Import actions
-        self._add_action(import_menu, "Import Excel File", "excel.png", "Ctrl+I", 
-                         "Import data from Excel file (Ctrl+I)", self._import_excel)
-        
-        self._add_action(import_menu, "Import RUL File", "rul.png", "Ctrl+R",
-                         "Import data from Altium RUL file (Ctrl+R)", self._import_rul)
+        self._add_actions(import_menu, self._IMPORT_MENU_ACTIONS)
         
         # Export submenu
         export_menu = QMenu("&Export", self)
-        export_menu.setIcon(QIcon(os.path.join(self.icons_path, "export.png")))
+        export_menu.setIcon(self._icon("export.png"))
         self.file_menu.addMenu(export_menu)
         
-        # Export actions
-        # Restore the Export to Excel action
-        self._add_action(export_menu, "Export to Excel", "excel.png", "Ctrl+E",
-                         "Export data to Excel file (Ctrl+E)", self._export_excel)
-        
-        self._add_action(export_menu, "Export RUL File", "rul.png", "Ctrl+S",
-                         "Export data to Altium RUL file (Ctrl+S)", self._export_rul)
+        # Export actions, disabled while a background export runs
+        self._export_actions = self._add_actions(export_menu, self._EXPORT_MENU_ACTIONS)
         
         self.file_menu.addSeparator()
         
         # Exit action
-        self._add_action(self.file_menu, "E&xit", "exit.png", "Alt+F4", 
-                         "Exit the application (Alt+F4)", self.close)
+        self._add_actions(self.file_menu, self._FILE_MENU_ACTIONS)
     
     def _create_edit_menu(self):
         """Create edit menu and actions"""
         self.edit_menu = self.menuBar().addMenu("&Edit")
         
         # Preferences action
-        self._add_action(self.edit_menu, "&Preferences", "settings.png", "Ctrl+P",
-                         "Open application preferences (Ctrl+P)", self._show_preferences)
+        self._add_actions(self.edit_menu, self._EDIT_MENU_ACTIONS)
     
     def _create_view_menu(self):
         """Create view menu and actions"""
         self.view_menu = self.menuBar().addMenu("&View")
         
-        # Update action text and callback if desired, but keep callback name for now
-        self._add_action(self.view_menu, "Show &Rule Manager", "settings.png", None,
-                         "Open the Rule Manager tab", self._show_rule_editor_tab) # Keep callback name for now
+        self._add_actions(self.view_menu, self._VIEW_MENU_ACTIONS)
         
         self.view_menu.addSeparator()
 
@@ -269,22 +428,17 @@ class MainWindow(QMainWindow):
         theme_group = QActionGroup(self)
         theme_group.setExclusive(True) # Only one theme can be active
 
-        light_theme_action = self._add_action(self.theme_menu, "&Light", None, None,
-                                              "Switch to Light Theme", lambda: self._change_theme("light"),
-                                              checkable=True)
-        dark_theme_action = self._add_action(self.theme_menu, "&Dark", None, None,
-                                             "Switch to Dark Theme", lambda: self._change_theme("dark"),
-                                             checkable=True)
-
-        theme_group.addAction(light_theme_action)
-        theme_group.addAction(dark_theme_action)
-
-        # Set the initially checked theme action
         current_theme = self.theme_manager.get_current_theme()
-        if current_theme == "dark":
-            dark_theme_action.setChecked(True)
-        else:
-            light_theme_action.setChecked(True) # Default to light
+        for theme_name in self.theme_manager.get_available_themes():
+            label = theme_name.capitalize()
+            theme_action = self._add_action(self.theme_menu, f"&{label}", None, None,
+                                            f"Switch to {label} Theme",
+                                            lambda checked=False, name=theme_name: self._change_theme(name),
+                                            checkable=True)
+            theme_action.setData(theme_name) # Used by _change_theme to update checkmarks
+            theme_group.addAction(theme_action)
+            # Set the initially checked theme action
+            theme_action.setChecked(theme_name == current_theme)
 
     def _change_theme(self, theme_name):
         """Applies the selected theme."""
@@ -307,8 +461,7 @@ class MainWindow(QMainWindow):
         self.help_menu = self.menuBar().addMenu("&Help")
         
         # About action
-        self._add_action(self.help_menu, "&About", "about.png", None,
-                         "Show information about the application", self._show_about)
+        self._add_actions(self.help_menu, self._HELP_MENU_ACTIONS)
     
     def _show_about(self):
         """Show the About dialog."""
@@ -324,12 +477,16 @@ class MainWindow(QMainWindow):
                           "Copyright © 2025 Karl Long (klong4) / eControls")
         logger.info("Showed About dialog.")
 
+    def _icon(self, icon_name):
+        """Return the QIcon for a file in the icons directory."""
+        return _load_icon(os.path.join(self.icons_path, icon_name))
+
     def _add_action(self, parent, text, icon_name, shortcut, tooltip, callback, checkable=False):
         """Helper method to create and add actions"""
         action = QAction(text, self)
         
         if icon_name:
-            action.setIcon(QIcon(os.path.join(self.icons_path, icon_name)))
+            action.setIcon(self._icon(icon_name))
         
         if shortcut:
             action.setShortcut(QKeySequence(shortcut))
@@ -340,6 +497,11 @@ class MainWindow(QMainWindow):
         parent.addAction(action)
         return action
 
+    def _add_actions(self, parent, specs):
+        """Create an action for each (text, icon, shortcut, tooltip, callback name) spec and return them"""
+        return [self._add_action(parent, text, icon_name, shortcut, tooltip, getattr(self, callback_name))
+                for text, icon_name, shortcut, tooltip, callback_name in specs]
+
     def _create_toolbar(self):
         """Create main toolbar"""
         self.toolbar = QToolBar("Main Toolbar")
@@ -354,11 +516,8 @@ class MainWindow(QMainWindow):
         self.toolbar.setIconSize(QSize(32, 32))
         
         # Add toolbar actions
-        self._add_toolbar_action("excel_import.png", "Import Excel", "Ctrl+I", 
-                                 "Import data from Excel file (Ctrl+I)", self._import_excel)
-        
-        self._add_toolbar_action("rul_import.png", "Import RUL", "Ctrl+R",
-                                 "Import data from Altium RUL file (Ctrl+R)", self._import_rul)
+        for text, icon_name, shortcut, tooltip, callback_name in self._TOOLBAR_ACTIONS:
+            self._add_toolbar_action(icon_name, text, shortcut, tooltip, getattr(self, callback_name))
         
         # self.toolbar.addSeparator() # Separator removed as export buttons are gone
         
@@ -372,7 +531,7 @@ class MainWindow(QMainWindow):
     
     def _add_toolbar_action(self, icon_name, text, shortcut, tooltip, callback):
         """Helper method to create and add toolbar actions"""
-        action = QAction(QIcon(os.path.join(self.icons_path, icon_name)), text, self)
+        action = QAction(self._icon(icon_name), text, self)
         if shortcut:
             action.setShortcut(QKeySequence(shortcut))
         action.setToolTip(tooltip)
@@ -383,18 +542,17 @@ class MainWindow(QMainWindow):
     def _save_geometry(self):
         """Save window size and position to settings"""
         try:
-            # Save window geometry
             geometry = self.saveGeometry()
-            self.config.set("window_geometry", geometry.toBase64().data().decode())
-            
-            # Save window state
             state = self.saveState()
-            self.config.set("window_state", state.toBase64().data().decode())
-            
-            # Save current tab index
             current_tab = self.tab_widget.currentIndex()
-            self.config.set("current_tab", current_tab)
-            
+
+            # Write all values in one go so closing only hits the disk once
+            self.config.update({
+                "window_geometry": geometry.toBase64().data().decode(),
+                "window_state": state.toBase64().data().decode(),
+                "current_tab": current_tab,
+            })
+
             logger.info("Saved window geometry and state")
         except Exception as e:
             logger.error(f"Error saving window geometry: {str(e)}")
@@ -403,27 +561,17 @@ class MainWindow(QMainWindow):
         """Restore window size and position from settings"""
         try:
             # Restore window geometry if it exists
-            # Use 'in' operator to check for key existence in the config dictionary
-            if "window_geometry" in self.config.config:
-                geometry_bytes = self.config.get("window_geometry", "")
-                if geometry_bytes:
-                    from PyQt5.QtCore import QByteArray
-                    geometry = QByteArray.fromBase64(geometry_bytes.encode())
-                    self.restoreGeometry(geometry)
+            geometry_bytes = self.config.get("window_geometry")
+            if geometry_bytes:
+                self.restoreGeometry(QByteArray.fromBase64(geometry_bytes.encode()))
             
             # Restore window state if it exists
-            if "window_state" in self.config.config:
-                state_bytes = self.config.get("window_state", "")
-                if state_bytes:
-                    from PyQt5.QtCore import QByteArray
-                    state = QByteArray.fromBase64(state_bytes.encode())
-                    self.restoreState(state)
+            state_bytes = self.config.get("window_state")
+            if state_bytes:
+                self.restoreState(QByteArray.fromBase64(state_bytes.encode()))
             
-            # Restore current tab if it exists
-            if "current_tab" in self.config.config:
-                current_tab = int(self.config.get("current_tab", 0))
-                if 0 <= current_tab < self.tab_widget.count():
-                    self.tab_widget.setCurrentIndex(current_tab)
+            # Switch tabs once the event loop runs, so a tab built on first visit does not delay the first paint
+            QTimer.singleShot(0, self._restore_current_tab)
             
             logger.info("Restored window geometry and state")
         except Exception as e:
@@ -441,16 +589,35 @@ class MainWindow(QMainWindow):
             else:
                 logger.warning("QApplication instance not found, cannot center window.")
 
+    def _restore_current_tab(self):
+        """Select the tab that was current when the window was last closed."""
+        try:
+            current_tab = self.config.get("current_tab")
+            if current_tab is not None:
+                current_tab = int(current_tab)
+                if 0 <= current_tab < self.tab_widget.count():
+                    self.tab_widget.setCurrentIndex(current_tab)
+        except Exception as e:
+            logger.error(f"Error restoring current tab: {str(e)}", exc_info=True)
+
     def _get_file_path_dialog(self, dialog_type: str, title: str, 
                               directory_key: str = "last_directory", 
-                              file_filter: str = "All Files (*)") -> str:
-        """Helper method to show a file dialog (open or save) and return the selected path."""
+                              file_filter: str = "All Files (*)",
+                              default_suffix: Optional[str] = None) -> str:
+        """Helper method to show a file dialog (open or save) and return the selected path.
+
+        Args:
+            default_suffix (str): For save dialogs, extension (e.g. "RUL") appended when the
+                                  chosen filter is the one for that extension and the name lacks it.
+        """
         last_dir = self.config.get(directory_key, "")
         
         if dialog_type == "open":
-            file_path, _ = QFileDialog.getOpenFileName(self, title, last_dir, file_filter)
+            file_path, selected_filter = QFileDialog.getOpenFileName(self, title, last_dir, file_filter,
+                                                                     options=_FILE_DIALOG_OPTIONS)
         elif dialog_type == "save":
-            file_path, _ = QFileDialog.getSaveFileName(self, title, last_dir, file_filter)
+            file_path, selected_filter = QFileDialog.getSaveFileName(self, title, last_dir, file_filter,
+                                                                     options=_FILE_DIALOG_OPTIONS)
         else:
             logger.error(f"Invalid dialog type specified: {dialog_type}")
             return None
@@ -458,9 +625,10 @@ class MainWindow(QMainWindow):
         if file_path:
             # Update the last used directory in the config
             self.config.set(directory_key, os.path.dirname(file_path))
-            # Ensure .RUL extension for save dialog if needed (could be more generic)
-            if dialog_type == "save" and "RUL Files" in file_filter and not file_path.upper().endswith('.RUL'):
-                 file_path += '.RUL'
+            # Add the extension only if the user saved under its filter, not "All Files"
+            if (dialog_type == "save" and default_suffix and f"*.{default_suffix}" in selected_filter
+                    and os.path.splitext(file_path)[1].lower() != f".{default_suffix.lower()}"):
+                file_path += f".{default_suffix}"
             return file_path
         else:
             return None # User cancelled
@@ -485,66 +653,174 @@ class MainWindow(QMainWindow):
             error_msg = f"Error importing Excel file: {str(e)}"
             logger.error(error_msg)
             QMessageBox.critical(self, "Import Error", error_msg)
-            self.status_bar.showMessage("Import failed", 5000)
+            self._show_status("Import failed", 5000)
 
     def _process_excel_import(self, file_path):
         """Process Excel import from the given file path"""
-        from services.excel_importer import ExcelImporter
-        excel_importer = ExcelImporter()
-        
-        try:
-            # Get sheet names
-            sheet_names = excel_importer.get_sheet_names(file_path)
-        except Exception as e:
-            error_msg = f"Error reading sheet names from {os.path.basename(file_path)}: {str(e)}"
-            logger.error(error_msg)
-            QMessageBox.critical(self, "Import Error", error_msg)
+        if self._excel_import_context is not None:
+            self._show_status("An Excel import is already in progress.", 5000)
             return
-        
+
+        from services.excel_importer import ExcelImporter
+
+        # Each blocking step runs on the thread pool; widgets are only touched from the slots
+        file_name = os.path.basename(file_path) # Used by every message of this import
+        self._excel_import_context = {"file_path": file_path, "file_name": file_name, "importer": ExcelImporter()}
+        self._start_import_step(
+            f"Reading sheet names from {file_name}...",
+            f"Error reading sheet names from {file_name}",
+            self._on_excel_sheet_names_read,
+            self._excel_import_context["importer"].get_sheet_names, file_path)
+
+    def _start_import_step(self, label, error_prefix, on_finished, fn, *args):
+        """Run one blocking step of the Excel import in the background behind a modal busy dialog.
+
+        Args:
+            label (str): Text shown in the progress dialog and status bar.
+            error_prefix (str): Prefix of the error message shown if the step fails.
+            on_finished: Slot receiving the step's result on the GUI thread.
+            fn: Callable to run on the thread pool, followed by its arguments.
+        """
+        self._excel_import_context["error_prefix"] = error_prefix
+        worker = Worker(fn, *args)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(self._on_excel_import_step_failed)
+        self._show_status(label)
+        self._show_import_progress(label)
+        QThreadPool.globalInstance().start(worker)
+
+    def _show_import_progress(self, label):
+        """Show the modal busy indicator used while an Excel or RUL import step runs."""
+        if self._import_progress is None:
+            self._import_progress = QProgressDialog(self)
+            self._import_progress.setWindowTitle("Importing File")
+            self._import_progress.setWindowModality(Qt.ApplicationModal)
+            self._import_progress.setCancelButton(None) # Background steps cannot be interrupted
+            self._import_progress.setRange(0, 0) # Busy indicator, step sizes are unknown
+            self._import_progress.setMinimumDuration(0)
+            self._import_progress.setAutoClose(False)
+            self._import_progress.setAutoReset(False)
+        self._import_progress.setLabelText(label)
+        self._import_progress.show()
+
+    def _hide_import_progress(self):
+        """Hide the import busy indicator and clear the status message."""
+        if self._import_progress is not None:
+            self._import_progress.hide()
+        self._show_status("")
+
+    def _end_excel_import(self):
+        """Finish the current Excel import and return its context."""
+        context = self._excel_import_context
+        self._excel_import_context = None
+        self._hide_import_progress()
+        return context
+
+    def _on_excel_import_step_failed(self, message):
+        """Report a failure of a background Excel import step."""
+        context = self._end_excel_import()
+        error_msg = f"{context['error_prefix']}: {message}"
+        logger.error(error_msg)
+        QMessageBox.critical(self, "Import Error", error_msg)
+        self._show_status("Import failed", 5000)
+
+    def _on_excel_sheet_names_read(self, sheet_names):
+        """Ask for the sheet to import once the sheet names have been read."""
+        self._hide_import_progress()
+        context = self._excel_import_context
+        file_path = context["file_path"]
+
         # If multiple sheets, ask user which one to import
         sheet_name = self._get_sheet_selection(sheet_names)
         if not sheet_name:
+            self._end_excel_import()
             logger.info("Excel import cancelled during sheet selection.")
             return  # User cancelled
 
+        # Read the sheet on the thread pool; the import continues in _on_excel_sheet_read
+        context["sheet_name"] = sheet_name
+        self._start_import_step(
+            f"Reading sheet '{sheet_name}' from {context['file_name']}...",
+            f"Error reading data from sheet '{sheet_name}' in {context['file_name']}",
+            self._on_excel_sheet_read,
+            context["importer"].import_file, file_path, sheet_name)
+
+    def _on_excel_sheet_read(self, raw_df):
+        """Continue the Excel import on the GUI thread once the sheet has been read."""
+        self._hide_import_progress()
         try:
-            # Import raw Excel data for preview
-            raw_df = excel_importer.import_file(file_path, sheet_name)
+            self._preview_excel_import(raw_df)
         except Exception as e:
-            error_msg = f"Error reading data from sheet '{sheet_name}' in {os.path.basename(file_path)}: {str(e)}"
+            self._end_excel_import()
+            error_msg = f"Error importing Excel file: {str(e)}"
             logger.error(error_msg)
             QMessageBox.critical(self, "Import Error", error_msg)
-            return
+            self._show_status("Import failed", 5000)
 
+    def _preview_excel_import(self, raw_df):
+        """Preview the raw sheet data, then load it into pivot data in the background"""
+        context = self._excel_import_context
+        file_name = context["file_name"]
         # Show preview dialog using the existing helper method
-        processed_df, import_options = self._show_excel_preview(raw_df, sheet_name)
+        processed_df, import_options = self._show_excel_preview(raw_df, context["sheet_name"])
         
         # If user cancels preview, abort import
         if processed_df is None or import_options is None:
+            self._end_excel_import()
             logger.info("Excel import cancelled during preview.")
             return
         
         if processed_df.empty:
+            self._end_excel_import()
             QMessageBox.warning(self, "Import Warning", "No data to import after processing.")
             logger.warning("Excel import resulted in empty dataframe after processing.")
             return
 
+        # Re-importing identical data into an unedited pivot tab only needs a tab switch
+        pivot_hash = self._dataframe_fingerprint(processed_df)
+        if pivot_hash is not None and pivot_hash == self._last_pivot_hash and self.pivot_tab is not None:
+            self._end_excel_import()
+            self.tab_widget.setCurrentWidget(self.pivot_tab)
+            self._show_status(f"{file_name} is unchanged; Pivot Table already up to date.", 5000)
+            logger.info("Imported data matches the loaded pivot data, skipping reload.")
+            return
+
+        context["pivot_hash"] = pivot_hash
+        context["shape"] = processed_df.shape
+        self._start_import_step(
+            f"Loading {file_name} into the Pivot Table...",
+            "Error loading data into pivot table",
+            self._on_excel_pivot_data_loaded,
+            self._load_pivot_data, processed_df)
+
+    @staticmethod
+    def _load_pivot_data(processed_df):
+        """Build an ExcelPivotData from the processed DataFrame. Runs on the thread pool."""
+        from models.excel_data import ExcelPivotData
+        pivot_data_obj = ExcelPivotData()
+        # Assuming the unit needs to be determined or defaulted, e.g., UnitType.MIL
+        # You might need to get the unit from the import options or elsewhere
+        if not pivot_data_obj.load_dataframe(processed_df, unit=UnitType.MIL):
+            raise ValueError("Failed to load DataFrame into ExcelPivotData object.")
+        return pivot_data_obj
+
+    def _on_excel_pivot_data_loaded(self, pivot_data_obj):
+        """Create or update the Pivot Table tab once the pivot data has been built"""
+        context = self._end_excel_import()
+        file_name = context["file_name"]
+        rows, columns = context["shape"]
+
         # --- Create or Update Pivot Table Tab ---
         if self.pivot_tab is None:
             try:
-                from gui.pivot_table_widget import PivotTableWidget
-                self.pivot_tab = PivotTableWidget()
-                # Connect signals
-                if hasattr(self.pivot_tab, 'model') and self.pivot_tab.model:
-                    self.pivot_tab.model.data_changed.connect(self._on_data_changed)
+                index = self._placeholder_index("pivot")
+                if index >= 0:
+                    self._replace_placeholder(index, self._create_pivot_tab())
                 else:
-                    logger.warning("PivotTableWidget created without a model, cannot connect data_changed signal.")
-                # Connect the rules_generated signal
-                self.pivot_tab.rules_generated.connect(self._handle_generated_rules)
-
-                index = self.tab_widget.addTab(self.pivot_tab, "Pivot Table")
-                self.tab_widget.setCurrentIndex(index)
-                logger.info("Pivot Table tab created.")
+                    pivot_tab = self._create_pivot_tab()
+                    with self._tabbar_frozen():
+                        index = self.tab_widget.addTab(pivot_tab, "Pivot Table")
+                        self.tab_widget.setCurrentIndex(index)
             except Exception as e:
                 logger.error(f"Failed to create Pivot Table tab: {e}", exc_info=True)
                 QMessageBox.critical(self, "Error", f"Could not create the Pivot Table tab: {e}")
@@ -552,38 +828,30 @@ class MainWindow(QMainWindow):
                 return # Stop import if tab creation fails
         else:
             # Find the index of the existing pivot tab and switch to it
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.widget(i) == self.pivot_tab:
-                    self.tab_widget.setCurrentIndex(i)
-                    break
+            index = self.tab_widget.indexOf(self.pivot_tab)
+            if index >= 0:
+                self.tab_widget.setCurrentIndex(index)
             logger.info("Switched to existing Pivot Table tab.")
-            # Ensure signal is connected even if tab existed
-            try:
-                self.pivot_tab.rules_generated.disconnect(self._handle_generated_rules) # Disconnect first to avoid duplicates
-            except TypeError:
-                pass # Signal was not connected
-            self.pivot_tab.rules_generated.connect(self._handle_generated_rules)
+            # rules_generated stays connected from _create_pivot_tab until the tab is closed
 
 
         # Load data into the pivot tab
         try:
-            # Create an ExcelPivotData object and load the DataFrame
-            pivot_data_obj = ExcelPivotData()
-            # Assuming the unit needs to be determined or defaulted, e.g., UnitType.MIL
-            # You might need to get the unit from the import options or elsewhere
-            from models.rule_model import UnitType # Add import if not already present
-            if pivot_data_obj.load_dataframe(processed_df, unit=UnitType.MIL): # Pass the DataFrame here
-                self.pivot_tab.set_pivot_data(pivot_data_obj) # Pass the ExcelPivotData object
-                logger.info(f"Loaded data ({processed_df.shape[0]}x{processed_df.shape[1]}) into Pivot Table tab.")
-                # Update rule editor if it exists
-                if self.rules_manager_tab and hasattr(self.pivot_tab, 'get_pivot_data'):
-                    # get_pivot_data should return the ExcelPivotData object
-                    current_pivot_data = self.pivot_tab.get_pivot_data() 
-                    if current_pivot_data:
-                        self.rules_manager_tab.update_pivot_data(current_pivot_data)
-                        logger.info("Updated Rule Manager with new pivot data.")
+            if self.pivot_tab.isVisible():
+                # Silence the model while it is repopulated, then announce one reset
+                model = self.pivot_tab.model
+                model.blockSignals(True)
+                try:
+                    self.pivot_tab.set_pivot_data(pivot_data_obj) # Pass the ExcelPivotData object
+                finally:
+                    model.blockSignals(False)
+                model.beginResetModel()
+                model.endResetModel()
             else:
-                 raise ValueError("Failed to load DataFrame into ExcelPivotData object.")
+                # e.g. window minimized; the model is filled when the tab is next shown
+                self.pivot_tab.queue_pivot_data(pivot_data_obj)
+            self._last_pivot_hash = context["pivot_hash"]
+            logger.info(f"Loaded data ({rows}x{columns}) into Pivot Table tab.")
         except Exception as e:
             error_msg = f"Error loading data into pivot table: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -593,14 +861,24 @@ class MainWindow(QMainWindow):
             return
 
         # --- Update Status and Show Message --- 
-        self.status_bar.showMessage(f"Successfully imported {os.path.basename(file_path)}", 5000)
-        QMessageBox.information(self, "Import Successful", 
-                              f"Successfully imported {os.path.basename(file_path)}.\n\n"
-                              f"Sheet: {sheet_name}\n"
-                              f"Rows: {processed_df.shape[0]}\n"
-                              f"Columns: {processed_df.shape[1]}")
+        self._show_status(f"Successfully imported {file_name}", 5000)
+        self._show_success("Import Successful",
+                              f"Successfully imported {file_name}.\n\n"
+                              f"Sheet: {context['sheet_name']}\n"
+                              f"Rows: {rows}\n"
+                              f"Columns: {columns}")
         self._check_unsaved_changes() # Check unsaved status after import
     
+    @staticmethod
+    def _dataframe_fingerprint(df):
+        """Return a content hash of df (values, index and headers), or None if it cannot be hashed."""
+        import pandas as pd # Already loaded by the importer that produced df
+        try:
+            values_hash = int(pd.util.hash_pandas_object(df, index=True).sum())
+            return hash((values_hash, tuple(map(str, df.columns))))
+        except TypeError:
+            return None # Unhashable cell contents; always reload
+
     def _get_sheet_selection(self, sheet_names):
         """Get sheet selection from user"""
         if len(sheet_names) > 1:
@@ -628,18 +906,11 @@ class MainWindow(QMainWindow):
     
     def _validate_dataframe(self, df):
         """Validate the dataframe to ensure it has data"""
-        if df.empty:
+        # A single size check covers no rows, no columns, or both
+        if df.size == 0:
             QMessageBox.warning(self, "Import Warning", "The imported Excel file contains no data.")
             return False
 
-        if df.shape[0] == 0:
-            QMessageBox.warning(self, "Import Warning", "The imported Excel file contains no rows.")
-            return False
-
-        if df.shape[1] == 0:
-            QMessageBox.warning(self, "Import Warning", "The imported Excel file contains no columns.")
-            return False
-            
         return True
     
     def _get_row_range(self, df):
@@ -660,6 +931,10 @@ class MainWindow(QMainWindow):
     
     def _import_rul(self):
         """Import data from Altium RUL file"""
+        if self._rul_import_path is not None:
+            self._show_status("A RUL import is already in progress.", 5000)
+            return
+
         file_path = self._get_file_path_dialog(
             dialog_type="open",
             title="Import RUL File",
@@ -672,6 +947,32 @@ class MainWindow(QMainWindow):
         # Update last directory - Handled by _get_file_path_dialog now
         # self.config.update_last_directory(os.path.dirname(file_path))
 
+        # Parse on the thread pool; the import continues in _on_rul_parsed
+        self._rul_import_path = file_path
+        worker = Worker(self._parse_rul_file, file_path)
+        worker.signals.finished.connect(self._on_rul_parsed)
+        worker.signals.error.connect(self._on_rul_parse_failed)
+        label = f"Reading rules from {os.path.basename(file_path)}..."
+        self._show_status(label)
+        self._show_import_progress(label)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def _parse_rul_file(file_path):
+        """Parse a RUL file into a new RuleManager. Runs on the thread pool."""
+        parsed_manager = RuleManager()
+        # Parses the file, or reuses the cached parse of identical content
+        if not parsed_manager.import_from_rul(file_path):
+            raise ValueError("No valid rules found in the file.")
+        return parsed_manager
+
+    def _on_rul_parsed(self, parsed_manager):
+        """Load the parsed rules into the Rule Manager tab on the GUI thread."""
+        file_path = self._rul_import_path
+        self._rul_import_path = None
+        self._hide_import_progress()
+        logger.info(f"Rules imported into RuleManager from {file_path}")
+
         try:
             # Ensure rule manager tab exists before importing RUL
             # Use renamed variable
@@ -681,102 +982,142 @@ class MainWindow(QMainWindow):
                 if self.rules_manager_tab is None: # Check again if creation failed
                     raise RuleGeneratorError("Could not create or find the Rule Manager tab.")
 
-            # Get the current rule manager or create a new one
-            # Use renamed variable
-            rule_manager = self.rules_manager_tab.get_rule_manager()
-            if rule_manager is None:
-                rule_manager = RuleManager()
-                logger.info("Created a new RuleManager for RUL import.")
-
-            # Use RuleGenerator to parse the file into the manager
-            # (Assuming RuleGenerator needs a method like parse_rul_file)
-            # This part might need adjustment based on RuleGenerator's capabilities
-            try:
-                # Placeholder: Assume RuleGenerator has a method to load rules into a manager
-                # You might need to implement this method in RuleGenerator
-                # generator = RuleGenerator()
-                # generator.rule_manager = rule_manager # Assign the manager
-                # Example: generator.parse_rul_file(file_path) # This method needs to exist
-                # For now, let's assume RuleManager has an import method for simplicity here.
-                # This depends heavily on how RUL parsing is implemented.
-                if not hasattr(rule_manager, 'import_from_rul'):
-                     raise NotImplementedError("RuleManager does not have an 'import_from_rul' method.")
-
-                rule_manager.import_from_rul(file_path) # Assumes this method exists and handles parsing
-                logger.info(f"Rules imported into RuleManager from {file_path}")
-
-            except Exception as parse_error:
-                 raise RuleGeneratorError(f"Failed to parse RUL file: {parse_error}") from parse_error
-
-
-            # Set the updated rule manager back to the tab
-            # Use renamed variable
-            self.rules_manager_tab.set_rule_manager(rule_manager)
+            # The worker parsed into its own manager, so only its rules are handed to the tab
+            self.rules_manager_tab.set_and_load_rules(parsed_manager.rules)
 
-            self.status_bar.showMessage(f"Successfully imported {os.path.basename(file_path)}", 5000)
-            QMessageBox.information(self, "Import Successful", f"Successfully imported RUL file: {file_path}")
+            self._show_status(f"Successfully imported {os.path.basename(file_path)}", 5000)
+            self._show_success("Import Successful", f"Successfully imported RUL file: {file_path}")
             self._check_unsaved_changes() # Update unsaved status
 
         except RuleGeneratorError as rge:
              error_msg = f"Error importing RUL file: {str(rge)}"
              logger.error(error_msg)
              QMessageBox.critical(self, "Import Error", error_msg)
-             self.status_bar.showMessage("RUL import failed", 5000)
+             self._show_status("RUL import failed", 5000)
         except Exception as e:
             error_msg = f"An unexpected error occurred during RUL import: {str(e)}"
             logger.error(error_msg, exc_info=True)
             QMessageBox.critical(self, "Import Error", error_msg)
-            self.status_bar.showMessage("RUL import failed", 5000)
+            self._show_status("RUL import failed", 5000)
+
+    def _on_rul_parse_failed(self, message):
+        """Report a RUL file that could not be parsed in the background."""
+        self._rul_import_path = None
+        self._hide_import_progress()
+        error_msg = f"Error importing RUL file: Failed to parse RUL file: {message}"
+        logger.error(error_msg)
+        QMessageBox.critical(self, "Import Error", error_msg)
+        self._show_status("RUL import failed", 5000)
 
 
     def _export_excel(self):
         """Export pivot data to Excel file"""
-        if self.pivot_tab is None:
+        if self.pivot_tab is not None:
+            self.pivot_tab.apply_pending_updates() # Export what the tab will show, even if it is hidden
+        # rowCount is cheap; check it before asking for a path or rebuilding the pivot data
+        if self.pivot_tab is None or self.pivot_tab.model.rowCount() == 0:
             QMessageBox.warning(self, "Export Error", "No pivot table data to export.")
             return
+        if self._export_context is not None:
+            self._show_status("An export is already in progress.", 5000)
+            return
 
         file_path = self._get_file_path_dialog(
             dialog_type="save",
             title="Export Pivot Table to Excel",
-            file_filter="Excel Files (*.xlsx);;All Files (*)"
+            file_filter="Excel Files (*.xlsx);;All Files (*)",
+            default_suffix="xlsx"
         )
 
         if not file_path:
             return # User cancelled
 
-        # Update last directory - Handled by _get_file_path_dialog now
-        # self.config.update_last_directory(os.path.dirname(file_path))
-
-        try:
-            # Call the export method on the pivot table widget
-            if self.pivot_tab.export_to_excel(file_path):
-                 self.status_bar.showMessage(f"Successfully exported pivot data to {os.path.basename(file_path)}", 5000)
-                 QMessageBox.information(self, "Export Successful", f"Successfully exported pivot data to:\\n{file_path}")
-            # Error handling should ideally be within pivot_tab.export_to_excel
-            # else:
-            #     QMessageBox.critical(self, "Export Error", "Failed to export pivot data to Excel.")
-            #     self.status_bar.showMessage("Excel export failed", 5000)
+        # Snapshot the edited pivot on the GUI thread; only the file write runs in the background
+        updated_pivot_data = self.pivot_tab.model.get_updated_pivot_data()
+        if updated_pivot_data is None or updated_pivot_data.pivot_df is None:
+            QMessageBox.warning(self, "Export Error", "No valid pivot data available to export.")
+            logger.warning("Excel export failed: No valid pivot data.")
+            return
 
-        except Exception as e:
-            error_msg = f"An error occurred during Excel export: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            QMessageBox.critical(self, "Export Error", error_msg)
-            self.status_bar.showMessage("Excel export failed", 5000)
+        from services.excel_exporter import ExcelExporter
+        self._start_export(file_path, ExcelExporter().export_dataframe, updated_pivot_data.pivot_df, file_path, True)
+
+    def _start_export(self, file_path, fn, *args, on_saved=None):
+        """Run an export function on the thread pool with the export actions disabled."""
+        self._export_context = file_path
+        self._export_on_saved = on_saved
+        self._set_export_actions_enabled(False)
+        worker = Worker(fn, *args)
+        worker.signals.finished.connect(self._on_export_finished)
+        worker.signals.error.connect(self._on_export_failed)
+        self._show_status(f"Exporting to {os.path.basename(file_path)}...")
+        QThreadPool.globalInstance().start(worker)
+
+    def _set_export_actions_enabled(self, enabled):
+        """Enable or disable the File > Export actions."""
+        for action in self._export_actions:
+            action.setEnabled(enabled)
+
+    def _on_export_finished(self, _result):
+        """Report a completed background export."""
+        file_path = self._export_context
+        on_saved = self._export_on_saved
+        self._export_context = None
+        self._export_on_saved = None
+        self._set_export_actions_enabled(True)
+        if on_saved is not None:
+            on_saved()
+        self._show_status(f"Successfully exported to {os.path.basename(file_path)}", 5000)
+        logger.info(f"Successfully exported to {file_path}")
+        self._show_success("Export Successful", f"Successfully exported to:\n{file_path}")
+        self._check_unsaved_changes() # Update window title
+
+    def _on_export_failed(self, message):
+        """Report a failed background export."""
+        file_path = self._export_context
+        self._export_context = None
+        self._export_on_saved = None
+        self._set_export_actions_enabled(True)
+        error_msg = f"Error exporting to '{os.path.basename(file_path)}': {message}"
+        logger.error(error_msg)
+        QMessageBox.critical(self, "Export Error", error_msg)
+        self._show_status("Export failed", 5000)
+
+    def _make_rul_saved_callback(self, rules_tab):
+        """Return a callback that marks rules_tab saved, unless it was closed or replaced meanwhile."""
+        def on_saved():
+            if self.rules_manager_tab is rules_tab:
+                rules_tab.mark_saved()
+        return on_saved
+
+    def _export_rul_in_background(self):
+        """Export rules to Altium RUL file without blocking the GUI (File menu action)"""
+        return self._export_rul(background=True)
+
+    def _export_rul(self, background=False):
+        """Export rules to Altium RUL file
 
-    def _export_rul(self):
-        """Export rules to Altium RUL file"""
+        Args:
+            background (bool): Write the file on the thread pool and report the result
+                               when it finishes. The return value then only says whether
+                               the export was started, so save-before-close callers use
+                               the default blocking write.
+        """
         # Use renamed variable
-        if self.rules_manager_tab is None or not hasattr(self.rules_manager_tab, 'get_rule_manager'):
-            QMessageBox.warning(self, "Export Error", "Rule Manager tab is not open or does not support exporting.")
+        if self.rules_manager_tab is None:
+            QMessageBox.warning(self, "Export Error", "Rule Manager tab is not open.")
             logger.warning("Attempted to export RUL when Rule Manager tab is not available.")
             return False # Indicate failure/not applicable
 
-        # Use renamed variable
+        # Snapshot taken on the GUI thread; edits made while a background export runs do not reach it
         rule_manager = self.rules_manager_tab.get_rule_manager()
-        if not rule_manager or not rule_manager.rules:
+        if not rule_manager.rules:
             QMessageBox.warning(self, "Export Error", "No rules available in the Rule Manager to export.")
             logger.warning("Attempted to export RUL with no rules loaded in the manager.")
             return False # Indicate failure/nothing to save
+        if background and self._export_context is not None:
+            self._show_status("An export is already in progress.", 5000)
+            return False
 
         suggested_filename = "generated_rules.RUL"
         # You could potentially base the suggested name on an imported file if tracked
@@ -784,7 +1125,8 @@ class MainWindow(QMainWindow):
         file_path = self._get_file_path_dialog(
             dialog_type="save",
             title="Export Rules to Altium RUL File",
-            file_filter="RUL Files (*.RUL);;All Files (*)"
+            file_filter="RUL Files (*.RUL);;All Files (*)",
+            default_suffix="RUL"
         )
 
         if not file_path:
@@ -793,33 +1135,25 @@ class MainWindow(QMainWindow):
             # This prevents the closeEvent from aborting if the user cancels the save dialog.
             return True # User cancelled the dialog
 
-        # Ensure the filename ends with .RUL (case-insensitive check)
-        if not file_path.lower().endswith('.rul'):
-            file_path += '.RUL'
-
         # Update last directory - Handled by _get_file_path_dialog now
         # self.config.update_last_directory(os.path.dirname(file_path))
-        self.status_bar.showMessage(f"Exporting rules to {os.path.basename(file_path)}...", 3000)
         logger.info(f"Exporting rules to RUL file: {file_path}")
+        if background:
+            self._start_export(file_path, self._write_rul_file, rule_manager, file_path,
+                               on_saved=self._make_rul_saved_callback(self.rules_manager_tab))
+            return True
+        file_name = os.path.basename(file_path)
+        self._show_status(f"Exporting rules to {file_name}...", 3000)
 
         try:
-            rule_generator = RuleGenerator()
-            # Assign the manager from the editor to the generator instance
-            rule_generator.rule_manager = rule_manager
-            # Generate the RUL content using the assigned manager
-            rul_content = rule_generator.generate_rul_content()
+            self._write_rul_file(rule_manager, file_path)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(rul_content)
-
-            self.status_bar.showMessage(f"Successfully exported to {os.path.basename(file_path)}", 5000)
+            self._show_status(f"Successfully exported to {file_name}", 5000)
             logger.info(f"Successfully exported rules to {file_path}")
-            QMessageBox.information(self, "Export Successful", f"Rules successfully exported to:\\n{file_path}")
+            self._show_success("Export Successful", f"Rules successfully exported to:\\n{file_path}")
 
-            # Mark the tab as saved - Needs implementation in RulesManagerWidget
-            # if hasattr(self.rules_manager_tab, 'mark_saved'):
-            #     self.rules_manager_tab.mark_saved()
-            self._check_unsaved_changes() # Update window title
+            # The tab reports the cleared flag through unsaved_changes_changed, which updates the title
+            self.rules_manager_tab.mark_saved()
 
             return True # Indicate success
 
@@ -827,24 +1161,33 @@ class MainWindow(QMainWindow):
             error_msg = f"Error generating RUL content: {str(rge)}"
             logger.error(error_msg, exc_info=True)
             QMessageBox.critical(self, "Export Error", error_msg)
-            self.status_bar.showMessage("Export failed", 5000)
+            self._show_status("Export failed", 5000)
             return False # Indicate failure
         except IOError as ioe:
-            error_msg = f"Error writing RUL file '{os.path.basename(file_path)}': {str(ioe)}"
+            error_msg = f"Error writing RUL file '{file_name}': {str(ioe)}"
             logger.error(error_msg, exc_info=True)
             QMessageBox.critical(self, "Export Error", error_msg)
-            self.status_bar.showMessage("Export failed", 5000)
+            self._show_status("Export failed", 5000)
             return False # Indicate failure
         except Exception as e:
             error_msg = f"An unexpected error occurred during RUL export: {str(e)}"
             logger.error(error_msg, exc_info=True)
             QMessageBox.critical(self, "Export Error", error_msg)
-            self.status_bar.showMessage("Export failed", 5000)
+            self._show_status("Export failed", 5000)
             return False # Indicate failure
 
+    @staticmethod
+    def _write_rul_file(rule_manager, file_path):
+        """Write the RUL content for rule_manager to file_path. Safe to call off the GUI thread."""
+        # Write rule by rule rather than building the whole file content first. Binary mode keeps
+        # the \r\n separators from iter_rul_format as they are, like the Rule Manager tab's own export.
+        with atomic_open(file_path, 'wb', buffering=1 << 20) as f:
+            f.writelines(piece.encode('utf-8') for piece in rule_manager.iter_rul_format())
+
     def _show_preferences(self):
         """Show the preferences dialog."""
         # Pass the config manager and theme manager to the dialog
+        from gui.preferences_dialog import PreferencesDialog
         dialog = PreferencesDialog(self.config, self.theme_manager, self)
         # Execute the dialog modally
         dialog.exec_()
@@ -867,14 +1210,18 @@ class MainWindow(QMainWindow):
         logger.info(f"Received {len(generated_rules)} generated rules from pivot table.")
 
         try:
-            # Ensure the Rule Manager tab exists or create it
-            self._show_rule_editor_tab()
+            # Load with painting suspended so the tabs repaint once
+            self.tab_widget.setUpdatesEnabled(False)
+            try:
+                # Creates the Rule Manager tab if needed and switches to it
+                self._show_rule_editor_tab()
+                if self.rules_manager_tab:
+                    # Pass the generated rules to the Rule Manager tab using the new method
+                    self.rules_manager_tab.set_and_load_rules(generated_rules)
+            finally:
+                self.tab_widget.setUpdatesEnabled(True)
 
             if self.rules_manager_tab:
-                # Pass the generated rules to the Rule Manager tab using the new method
-                self.rules_manager_tab.set_and_load_rules(generated_rules)
-                # Switch to the Rule Manager tab
-                self.tab_widget.setCurrentWidget(self.rules_manager_tab) # Corrected: self.tabs -> self.tab_widget
                 logger.info("Loaded generated rules into Rule Manager tab and switched view.")
             else:
                 # Error already logged in _show_rule_editor_tab if creation failed
@@ -885,124 +1232,27 @@ class MainWindow(QMainWindow):
             logger.error(f"Error handling generated rules: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"An unexpected error occurred while handling generated rules: {e}")
 
-    def _show_rule_editor_tab(self):
-        """Creates or shows the Rule Manager tab."""
-        if self.rules_manager_tab is None:
-            try:
-                logger.info("Creating Rule Manager tab.")
-                self.rules_manager_tab = RulesManagerWidget(self) # Pass self as parent
-                # Connect signals
-                self.rules_manager_tab.unsaved_changes_changed.connect(self._update_window_title)
-                # Add other necessary signal connections here
-
-                tab_index = self.tab_widget.addTab(self.rules_manager_tab, "Rule Manager") # Corrected: self.tabs -> self.tab_widget
-                logger.info(f"Rule Manager tab created at index {tab_index}.")
-                # Rules are now loaded externally via set_and_load_rules, not here.
-            except Exception as e:
-                logger.error(f"Failed to create Rule Manager tab: {e}", exc_info=True)
-                QMessageBox.critical(self, "Error", f"Could not create the Rule Manager tab: {e}")
-                self.rules_manager_tab = None # Ensure it's None if creation failed
-                return # Stop here if creation failed
-
-        # Switch to the tab if it exists (even if just created)
-        if self.rules_manager_tab:
-            self.tab_widget.setCurrentWidget(self.rules_manager_tab) # Corrected: self.tabs -> self.tab_widget
-            logger.debug("Switched to Rule Manager tab.")
-        else:
-            logger.warning("Attempted to switch to Rule Manager tab, but it's None.")
-
-    def _update_window_title(self, has_unsaved_changes: Optional[bool] = None):
-        """Updates the window title to indicate unsaved changes."""
-        base_title = "Altium Rule Generator"
-        unsaved_marker = " [*]"
-
-        # Determine if any tab has unsaved changes
-        # If has_unsaved_changes is provided by signal, use it directly for that tab
-        # Otherwise, check all relevant tabs
-        # For now, let's assume only Rule Manager tracks this
-        is_unsaved = False
-        if self.rules_manager_tab and self.rules_manager_tab.has_unsaved_changes():
-            is_unsaved = True
-        # Add checks for other tabs if they implement has_unsaved_changes()
-        # elif self.pivot_table_tab and self.pivot_table_tab.has_unsaved_changes():
-        #     is_unsaved = True
-
-        new_title = base_title + (unsaved_marker if is_unsaved else "")
-
-        if self.windowTitle() != new_title:
-            self.setWindowTitle(new_title)
-            logger.debug(f"Window title updated: {new_title}")
-
-    def closeEvent(self, event):
-        """Handle the window close event."""
-        # Check for unsaved changes before closing
-        unsaved = False
-        if self.rules_manager_tab and self.rules_manager_tab.has_unsaved_changes():
-            unsaved = True
-        # Add checks for other tabs
-
-        if unsaved:
-            reply = QMessageBox.question(self,
-                                         "Unsaved Changes",
-                                         "There are unsaved changes. Do you want to save before exiting?",
-                                         QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
-                                         QMessageBox.Cancel)
-
-            if reply == QMessageBox.Save:
-                # Attempt to save rules (assuming only rule manager needs saving)
-                if self.rules_manager_tab:
-                    # Ideally, trigger the save action of the relevant widget
-                    # For now, let's assume _save_rules shows a dialog
-                    self.rules_manager_tab._save_rules() # This might show its own dialog
-                    # Re-check if changes were actually saved
-                    if self.rules_manager_tab.has_unsaved_changes():
-                        event.ignore() # Ignore close event if save failed or was cancelled
-                        return
-                    else:
-                        event.accept() # Accept close event if save was successful
-                else:
-                    event.accept() # No rule manager tab to save
-            elif reply == QMessageBox.Discard:
-                event.accept() # Discard changes and close
-            else: # Cancel
-                event.ignore() # Ignore the close event
-                return
-        else:
-            event.accept() # No unsaved changes, close normally
-
-        # Save window state if closing is accepted
-        if event.isAccepted():
-            self._save_geometry() # Renamed from _save_settings
-            logger.info("Application closing.")
-            super().closeEvent(event)
-
     # Add placeholder methods if needed by other parts, assuming they exist in widgets:
     # def _on_data_saved(self): ... # Might be called after successful export
 
     def _on_data_changed(self, *args, **kwargs):
         """Slot to handle data changes from tabs (e.g., pivot table, rule editor)."""
         logger.debug("Data changed signal received.")
+        self._last_pivot_hash = None # Pivot no longer matches the last import
         self._check_unsaved_changes()
 
-    def _on_rule_pivot_updated(self, pivot_data: ExcelPivotData):
-        """Slot to handle pivot data updates from the rule editor."""
-        if self.pivot_tab:
-            self.pivot_tab.set_pivot_data(pivot_data)
-            logger.info("Pivot table updated with data from rule editor.")
-        else:
-            logger.warning("Received pivot data update from rule editor, but pivot tab does not exist.")
-
     def _show_rule_editor_tab(self):
         """Creates or shows the Rule Manager tab."""
         if self.rules_manager_tab is None:
             try:
                 logger.info("Creating Rule Manager tab.")
-                self.rules_manager_tab = RulesManagerWidget(self) # Pass self as parent
-                # Connect signals
-                self.rules_manager_tab.unsaved_changes_changed.connect(self._update_window_title)
-                # Add other necessary signal connections here
-
-                tab_index = self.tab_widget.addTab(self.rules_manager_tab, "Rule Manager") # Corrected: self.tabs -> self.tab_widget
+                tab_index = self._placeholder_index("rules")
+                if tab_index >= 0:
+                    self._replace_placeholder(tab_index, self._create_rules_manager_tab())
+                else:
+                    rules_manager_tab = self._create_rules_manager_tab()
+                    with self._tabbar_frozen():
+                        tab_index = self.tab_widget.addTab(rules_manager_tab, "Rule Manager")
                 logger.info(f"Rule Manager tab created at index {tab_index}.")
                 # Rules are now loaded externally via set_and_load_rules, not here.
             except Exception as e:
@@ -1019,14 +1269,19 @@ class MainWindow(QMainWindow):
             logger.warning("Attempted to switch to Rule Manager tab, but it's None.")
 
     def _check_unsaved_changes(self):
+        """Schedules one unsaved-changes check for the next event loop pass."""
+        if self._unsaved_check_scheduled:
+            return # Already queued; bursts of changes collapse into a single check
+        self._unsaved_check_scheduled = True
+        QTimer.singleShot(0, self._do_check_unsaved_changes)
+
+    def _do_check_unsaved_changes(self):
         """Checks all open tabs for unsaved changes and updates the window title."""
-        has_changes = False
-        # Iterate through all widgets in the tab widget
-        for i in range(self.tab_widget.count()):
-            widget = self.tab_widget.widget(i)
-            if hasattr(widget, 'has_unsaved_changes') and widget.has_unsaved_changes():
-                has_changes = True
-                break # Found unsaved changes, no need to check further
+        self._unsaved_check_scheduled = False
+        has_changes = bool(self._dirty_tabs)
+        if has_changes == self._title_shows_unsaved:
+            return # Title already up to date
+        self._title_shows_unsaved = has_changes
         
         # Update window title if unsaved changes exist
         base_title = "Altium Rule Generator"
@@ -1048,13 +1303,14 @@ class MainWindow(QMainWindow):
         # Add checks for other tabs
 
         if unsaved:
+            save, discard, cancel = QMessageBox.Save, QMessageBox.Discard, QMessageBox.Cancel
             reply = QMessageBox.question(self,
                                          "Unsaved Changes",
                                          "There are unsaved changes. Do you want to save before exiting?",
-                                         QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
-                                         QMessageBox.Cancel)
+                                         save | discard | cancel,
+                                         cancel)
 
-            if reply == QMessageBox.Save:
+            if reply == save:
                 # Attempt to save rules (assuming only rule manager needs saving)
                 if self.rules_manager_tab:
                     # Ideally, trigger the save action of the relevant widget
@@ -1068,7 +1324,7 @@ class MainWindow(QMainWindow):
                         event.accept() # Accept close event if save was successful
                 else:
                     event.accept() # No rule manager tab to save
-            elif reply == QMessageBox.Discard:
+            elif reply == discard:
                 event.accept() # Discard changes and close
             else: # Cancel
                 event.ignore() # Ignore the close event
@@ -1079,5 +1335,7 @@ class MainWindow(QMainWindow):
         # Save window state if closing is accepted
         if event.isAccepted():
             self._save_geometry() # Renamed from _save_settings
+            # Changes were already saved or discarded above, so tear down without prompting
+            self._close_all_tabs()
             logger.info("Application closing.")
             super().closeEvent(event)
\ No newline at end of file
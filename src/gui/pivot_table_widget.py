@@ -26,6 +26,7 @@ from models.excel_data import ExcelPivotData
 from models.rule_model import UnitType, RuleType
 # Import RuleGeneratorError if needed for specific exception handling
 from services.rule_generator import RuleGenerator, RuleGeneratorError
+from services.excel_exporter import ExcelExporter
 
 
 logger = logging.getLogger(__name__)
@@ -35,14 +36,56 @@ class PivotTableModel(QAbstractTableModel):
 
     data_changed = pyqtSignal()
 
+    # Cell backgrounds, shared by every data() call instead of built per cell
+    _BRUSH_INDEX = QBrush(QColor("#404040")) # Darker gray for index column
+    _BRUSH_EVEN = QBrush(QColor("#323232")) # Dark theme color
+    _BRUSH_ODD = QBrush(QColor("#2d2d2d")) # Slightly lighter dark theme color
+    _ALIGN_CENTER = int(Qt.AlignCenter) # Plain int, converted once rather than per data() call
+
+    # Variable cells ('D', 'F') are stored as a code per cell; code 0 means the cell holds a number
+    _VARIABLE_NAMES = np.array(["", "D", "F"], dtype=object) # Indexed by variable code
+    _VARIABLE_CODES = {"D": 1, "F": 2}
+
     def __init__(self, parent=None):
         """Initialize pivot table model"""
         super().__init__(parent)
         self.pivot_data = None
         self.headers = []
         self.index_column = []
-        self.data_array = np.array([])
+        # Both data arrays stay C-contiguous (row-major), matching the view's row-by-row access;
+        # update them in place rather than replacing them with transposed or order='F' copies
+        self._vals = np.empty((0, 0), dtype=np.float64) # Numeric cell values, NaN where empty or a variable
+        self._var_codes = np.empty((0, 0), dtype=np.uint8) # Variable code of each cell, see _VARIABLE_NAMES
         self.editable = True
+        self._index_strs = [] # str() of each index_column entry
+        self._display_array = np.empty((0, 0), dtype=object) # Display text of each data cell
+
+    def _cell_text(self, row: int, data_col: int) -> str:
+        """Return the display text for a single data cell."""
+        code = self._var_codes[row, data_col]
+        if code:
+            return self._VARIABLE_NAMES[code]
+        value = self._vals[row, data_col]
+        return "" if np.isnan(value) else f"{value:.3f}" # Empty for NaN, floats to 3 decimal places
+
+    def _rebuild_display_cache(self):
+        """Recompute the display text of every cell from index_column, _vals and _var_codes."""
+        self._index_strs = [str(x) for x in self.index_column]
+        # Cells are float64 whatever the source column's dtype, so whole numbers show decimals too (5 -> 5.000)
+        display = np.char.mod("%.3f", self._vals).astype(object)
+        display[np.isnan(self._vals)] = "" # Display empty string for NaN
+        variable_mask = self._var_codes != 0
+        display[variable_mask] = self._VARIABLE_NAMES[self._var_codes[variable_mask]]
+        self._display_array = display
+
+    @classmethod
+    def _variable_codes(cls, raw_values: np.ndarray) -> np.ndarray:
+        """Return the uint8 variable code of each cell of an object array, 0 for non-variable cells."""
+        labels = np.char.upper(np.char.strip(raw_values.astype(str)))
+        codes = np.zeros(raw_values.shape, dtype=np.uint8)
+        for name, code in cls._VARIABLE_CODES.items():
+            codes[labels == name] = code
+        return codes
 
     def set_pivot_data(self, pivot_data: ExcelPivotData):
         """Set the pivot data to display"""
@@ -52,21 +95,26 @@ class PivotTableModel(QAbstractTableModel):
         if pivot_data is not None and pivot_data.pivot_df is not None:
             self.headers = pivot_data.column_index
             self.index_column = pivot_data.row_index
-            # Convert to numeric, coercing errors to NaN, but keep original object type if possible
+            raw_values = pivot_data.pivot_df.to_numpy(dtype=object)
+            self._var_codes = self._variable_codes(raw_values)
+            # Convert to numeric, coercing errors (including the variable cells) to NaN
             try:
                 # Attempt conversion using pandas.to_numeric for better handling
-                numeric_values = pivot_data.pivot_df.apply(pd.to_numeric, errors='coerce').values
-                self.data_array = numeric_values
+                numeric_values = pivot_data.pivot_df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+                self._vals = np.array(numeric_values, order='C') # Writable, contiguous copy
             except Exception as e:
-                logger.warning(f"Could not convert all pivot data to numeric using pd.to_numeric: {e}. Keeping original types.")
-                # Fallback: Keep original data but ensure it's a NumPy array
-                self.data_array = np.array(pivot_data.values, dtype=object) # Use dtype=object to preserve strings
+                logger.warning(f"Could not convert all pivot data to numeric using pd.to_numeric: {e}. Leaving non-numeric cells empty.")
+                self._vals = np.full(raw_values.shape, np.nan)
+            self._vals[self._var_codes != 0] = np.nan
         else:
             self.headers = []
             self.index_column = []
-            self.data_array = np.array([])
+            self._vals = np.empty((0, 0), dtype=np.float64)
+            self._var_codes = np.empty((0, 0), dtype=np.uint8)
 
+        self._rebuild_display_cache()
         self.endResetModel()
+        logger.debug(f"Pivot data arrays C-contiguous: {self._vals.flags.c_contiguous and self._var_codes.flags.c_contiguous}")
         logger.info(f"Pivot table model updated with {len(self.index_column)} rows and {len(self.headers)} columns")
 
     def rowCount(self, parent=None):
@@ -78,62 +126,45 @@ class PivotTableModel(QAbstractTableModel):
         # +1 for the index column
         return len(self.headers) + 1 if self.headers else 0
 
-    def data(self, index, role=Qt.DisplayRole):
-        """Return data for the given index and role"""
-        if not index.isValid():
-            return QVariant()
-
-        row, col = index.row(), index.column()
+    def _display_data(self, row: int, col: int):
+        """Return the precomputed text of a cell for the display and edit roles."""
+        # First column is the index column
+        if col == 0:
+            return self._index_strs[row] if row < len(self._index_strs) else None
 
-        # Check if row and column are valid
-        if row < 0 or row >= self.rowCount() or col < 0 or col >= self.columnCount():
-            return QVariant()
+        # Data columns
+        data_col = col - 1
+        # Check bounds for the data arrays
+        if row < self._display_array.shape[0] and data_col < self._display_array.shape[1]:
+            return self._display_array[row, data_col]
+        logger.warning(f"Data index out of bounds: row={row}, data_col={data_col}")
+        return None # Out of bounds
+
+    def _background_data(self, row: int, col: int):
+        """Return the shared background brush of a cell."""
+        # First column has a different color, data cells alternate by row
+        if col == 0:
+            return self._BRUSH_INDEX
+        return self._BRUSH_EVEN if row % 2 == 0 else self._BRUSH_ODD
 
-        # Handle display role
-        if role == Qt.DisplayRole or role == Qt.EditRole:
-            # First column is the index column
-            if col == 0:
-                return str(self.index_column[row]) if row < len(self.index_column) else QVariant()
-
-            # Data columns
-            data_col = col - 1
-            # Check bounds for data_array
-            if row < self.data_array.shape[0] and data_col < self.data_array.shape[1]:
-                value = self.data_array[row, data_col]
-                # Handle potential NaN or None values gracefully for display
-                if pd.isna(value) or value is None:
-                    return "" # Display empty string for NaN/None
-                # Format numeric values nicely, keep strings as is
-                if isinstance(value, (int, float, np.number)):
-                     # Basic formatting, could be refined (e.g., specific precision)
-                     # Check if it's a floating point number before formatting
-                     if isinstance(value, (float, np.floating)):
-                         return f"{value:.3f}" # Format floats to 3 decimal places
-                     else:
-                         return str(value) # Integers as strings
-                return str(value) # Return string representation for other types (like 'D', 'F')
-            else:
-                logger.warning(f"Data index out of bounds: row={row}, data_col={data_col}")
-                return QVariant() # Out of bounds
-
-        # Handle background color role
-        elif role == Qt.BackgroundRole:
-            # First column has different color (e.g., slightly darker gray)
-            if col == 0:
-                 return QBrush(QColor("#404040")) # Darker gray for index column
-
-            # Alternating row colors for data cells
-            if row % 2 == 0:
-                 return QBrush(QColor("#323232")) # Dark theme color
-            else:
-                 return QBrush(QColor("#2d2d2d")) # Slightly lighter dark theme color
+    def _alignment_data(self, row: int, col: int):
+        """Center-align all cells."""
+        return self._ALIGN_CENTER
 
-        # Handle text alignment role
-        elif role == Qt.TextAlignmentRole:
-            # Center-align all cells
-            return Qt.AlignCenter
+    # Roles answered by data(); views also query many roles this model leaves at their defaults
+    _ROLE_HANDLERS = {
+        Qt.DisplayRole: _display_data,
+        Qt.EditRole: _display_data,
+        Qt.BackgroundRole: _background_data,
+        Qt.TextAlignmentRole: _alignment_data,
+    }
 
-        return QVariant()
+    def data(self, index, role=Qt.DisplayRole):
+        """Return data for the given index and role"""
+        handler = self._ROLE_HANDLERS.get(role)
+        if handler is None or not index.isValid():
+            return None # PyQt converts None to an invalid QVariant
+        return handler(self, index.row(), index.column())
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """Return header data for the given section and orientation"""
@@ -186,106 +217,79 @@ class PivotTableModel(QAbstractTableModel):
              logger.warning("Attempted to edit read-only index column.")
              return False
 
-        # Update the data array
+        # Update the data arrays
         data_col = col - 1
-        if row >= self.data_array.shape[0] or data_col >= self.data_array.shape[1]:
+        if row >= self._vals.shape[0] or data_col >= self._vals.shape[1]:
             logger.error(f"setData index out of bounds: row={row}, col={col} (data_col={data_col})")
             return False
 
-        original_value = self.data_array[row, data_col]
-        new_value = None
+        original_value = self._vals[row, data_col]
+        original_code = self._var_codes[row, data_col]
+        new_value = np.nan
+        new_code = 0
 
-        # Keep string variables as strings, try converting others to float
+        # Store D/F as variable codes, convert anything else to float. Other text is rejected
+        # rather than stored: a cell holds a number or a variable, nothing that rules could not use
         if isinstance(value, str):
-            stripped_value = value.strip() # Keep case for D/F initially
-            if stripped_value.upper() in ['D', 'F']:
-                 # Store D/F as strings, but maybe handle them differently later?
-                 # For now, store as string. Conversion happens in get_updated_pivot_data or generation
-                 new_value = stripped_value
-            else:
-                 # Try converting other strings to float
+            stripped_value = value.strip()
+            if stripped_value.upper() in self._VARIABLE_CODES:
+                 # Conversion to numbers happens in replace_variables_in_data
+                 new_code = self._VARIABLE_CODES[stripped_value.upper()]
+            elif stripped_value != "": # Treat empty string as NaN
                  try:
-                     if stripped_value == "": # Treat empty string as NaN
-                         new_value = np.nan
-                     else:
-                         new_value = float(stripped_value)
+                     new_value = float(stripped_value)
                  except ValueError:
-                     logger.warning(f"Could not convert input '{value}' to float for cell ({row}, {data_col}). Keeping as string.")
-                     new_value = value # Keep original string if conversion fails and it wasn't D/F
+                     logger.warning(f"Could not convert input '{value}' to float for cell ({row}, {data_col}). Keeping the original value.")
+                     return False
         else:
              # Handle non-string input (e.g., from spinbox, already numeric)
              try:
                  new_value = float(value)
              except (ValueError, TypeError):
-                 logger.warning(f"Could not convert input '{value}' (type: {type(value)}) to float for cell ({row}, {data_col}).")
-                 # Decide fallback: keep original, set NaN, or keep as string? Let's try keeping original.
-                 new_value = original_value # Revert to original if conversion fails
-
+                 logger.warning(f"Could not convert input '{value}' (type: {type(value)}) to float for cell ({row}, {data_col}). Keeping the original value.")
+                 return False
 
         # Check if the value actually changed (handle NaN comparison)
-        # Use pd.isna for robust NaN check
-        if (new_value == original_value) or (pd.isna(new_value) and pd.isna(original_value)):
+        if new_code == original_code and (new_value == original_value or (np.isnan(new_value) and np.isnan(original_value))):
             return False # No actual change
 
-        self.data_array[row, data_col] = new_value
+        self._vals[row, data_col] = new_value
+        self._var_codes[row, data_col] = new_code
+        self._display_array[row, data_col] = self._cell_text(row, data_col)
         self.dataChanged.emit(index, index, [role]) # Emit signal for the specific cell
         self.data_changed.emit() # Emit custom signal indicating general data change
-        logger.debug(f"Data changed at ({row}, {data_col}) from {original_value} to {new_value}")
+        logger.debug(f"Data changed at ({row}, {data_col}) from {self._VARIABLE_NAMES[original_code] or original_value} to {self._VARIABLE_NAMES[new_code] or new_value}")
         return True
 
     def replace_variables_in_data(self, variables: Dict[str, float]) -> bool:
-        """Replace string variables ('D', 'F') in the data array with numeric values."""
-        if not variables or self.data_array is None or self.data_array.size == 0:
+        """Replace string variables ('D', 'F') in the data arrays with numeric values."""
+        if not variables or self._vals.size == 0:
             return False
 
-        modified = False
-        rows, cols = self.data_array.shape
-
-        # Create lists of QModelIndex for changed cells
-        changed_indexes = []
-
-        for r in range(rows):
-             for c in range(cols):
-                 current_value = self.data_array[r, c]
-                 # Check if it's a string and matches a variable key (case-insensitive)
-                 if isinstance(current_value, str):
-                     upper_val = current_value.upper()
-                     if upper_val in variables:
-                         new_value = variables[upper_val]
-                         # Check if value actually changes (handle potential type diff)
-                         try:
-                             # Compare numerically if possible
-                             if float(self.data_array[r, c]) != new_value:
-                                 self.data_array[r, c] = new_value
-                                 modified = True
-                                 index = self.index(r, c + 1) # +1 for model column
-                                 changed_indexes.append(index)
-                                 logger.debug(f"Replaced variable '{upper_val}' at ({r}, {c}) with {new_value}")
-                         except (ValueError, TypeError):
-                             # If current value wasn't numeric, compare directly
-                             if self.data_array[r, c] != str(new_value): # Compare as string if needed
-                                 self.data_array[r, c] = new_value
-                                 modified = True
-                                 index = self.index(r, c + 1) # +1 for model column
-                                 changed_indexes.append(index)
-                                 logger.debug(f"Replaced variable '{upper_val}' at ({r}, {c}) with {new_value}")
-
-
-        if modified:
-             # Emit dataChanged for the affected range
-             if changed_indexes:
-                 # Find min/max row/col for the signal range (more efficient)
-                 min_row = min(idx.row() for idx in changed_indexes)
-                 max_row = max(idx.row() for idx in changed_indexes)
-                 min_col = min(idx.column() for idx in changed_indexes)
-                 max_col = max(idx.column() for idx in changed_indexes)
-                 top_left = self.index(min_row, min_col)
-                 bottom_right = self.index(max_row, max_col)
-                 self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
-                 self.data_changed.emit() # Emit custom signal
-                 logger.info(f"Replaced variables {list(variables.keys())} in model data.")
-
-        return modified
+        # Lookup table from variable code to its value; NaN marks variables that are not being replaced
+        variable_values = np.full(len(self._VARIABLE_NAMES), np.nan)
+        for name, value in variables.items():
+            code = self._VARIABLE_CODES.get(name.upper())
+            if code is not None:
+                variable_values[code] = value
+
+        codes = self._var_codes
+        mask = (codes != 0) & ~np.isnan(variable_values[codes])
+        if not mask.any():
+            return False
+
+        self._vals[mask] = variable_values[codes[mask]]
+        codes[mask] = 0
+        self._display_array[mask] = np.char.mod("%.3f", self._vals[mask]).astype(object)
+
+        # Emit dataChanged for the bounding box of the replaced cells
+        changed_rows, changed_cols = np.nonzero(mask)
+        top_left = self.index(int(changed_rows.min()), int(changed_cols.min()) + 1) # +1 for model column
+        bottom_right = self.index(int(changed_rows.max()), int(changed_cols.max()) + 1)
+        self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
+        self.data_changed.emit() # Emit custom signal
+        logger.info(f"Replaced variables {list(variables.keys())} in {int(mask.sum())} cells of the model data.")
+        return True
 
     def get_updated_pivot_data(self) -> Optional[ExcelPivotData]:
         """Get updated pivot data from the model"""
@@ -299,14 +303,19 @@ class PivotTableModel(QAbstractTableModel):
             # unit=self.pivot_data.unit # Removed: unit is handled internally
         )
         # Manually set the unit after initialization if needed, based on original data
-        if self.pivot_data and hasattr(self.pivot_data, 'unit'):
+        if self.pivot_data is not None:
             updated_pivot_data.unit = self.pivot_data.unit
         
         updated_pivot_data.row_index = self.index_column[:] # Copy lists
         updated_pivot_data.column_index = self.headers[:]
-        # Ensure the data array is copied and potentially converted if D/F were stored as strings
-        # For now, assume data_array holds floats or NaNs after edits/replacements
-        updated_pivot_data.values = self.data_array.copy() # Copy numpy array
+        # Plain float array unless unreplaced D/F cells remain, which are written back as strings
+        if self._var_codes.any():
+            values = self._vals.astype(object)
+            variable_mask = self._var_codes != 0
+            values[variable_mask] = self._VARIABLE_NAMES[self._var_codes[variable_mask]]
+            updated_pivot_data.values = values
+        else:
+            updated_pivot_data.values = self._vals.copy() # Copy numpy array
 
         # Reconstruct DataFrame (optional but good for consistency)
         try:
@@ -315,17 +324,18 @@ class PivotTableModel(QAbstractTableModel):
             num_rows = len(self.index_column)
             num_cols = len(self.headers)
             current_data_shape = updated_pivot_data.values.shape
+            # values is already a private copy of the model data, so the DataFrame wraps it without copying again
 
             if current_data_shape == (num_rows, num_cols):
-                df = pd.DataFrame(updated_pivot_data.values, index=self.index_column, columns=self.headers)
+                df = pd.DataFrame(updated_pivot_data.values, index=self.index_column, columns=self.headers, copy=False)
             elif current_data_shape[0] == num_rows and current_data_shape[1] > num_cols:
                  # If data has more columns than headers, slice the data
                  logger.warning(f"Data shape {current_data_shape} has more columns than headers ({num_cols}). Slicing data.")
-                 df = pd.DataFrame(updated_pivot_data.values[:, :num_cols], index=self.index_column, columns=self.headers)
+                 df = pd.DataFrame(updated_pivot_data.values[:, :num_cols], index=self.index_column, columns=self.headers, copy=False)
             elif current_data_shape[0] > num_rows and current_data_shape[1] == num_cols:
                  # If data has more rows than index, slice the data
                  logger.warning(f"Data shape {current_data_shape} has more rows than index ({num_rows}). Slicing data.")
-                 df = pd.DataFrame(updated_pivot_data.values[:num_rows, :], index=self.index_column, columns=self.headers)
+                 df = pd.DataFrame(updated_pivot_data.values[:num_rows, :], index=self.index_column, columns=self.headers, copy=False)
             else:
                 # If shapes don't match in a way we can't easily fix, raise the original error after logging
                 logger.error(f"Shape mismatch: Data shape {current_data_shape}, Index length {num_rows}, Headers length {num_cols}")
@@ -350,15 +360,19 @@ class PivotTableWidget(QWidget):
     """Widget to display and edit pivot table data"""
 
     rules_generated = pyqtSignal(list) # Emits list[BaseRule]
+    unsaved_changes_changed = pyqtSignal(bool) # Emits True once loaded data is edited, False when data is (re)loaded
+
+    model: Optional[PivotTableModel] = None # Set in __init__
+    _unsaved_changes = False
 
     def __init__(self, parent=None):
         """Initialize pivot table widget"""
         super().__init__(parent)
 
         self.pivot_data: Optional[ExcelPivotData] = None
+        self._pending_pivot_data: Optional[ExcelPivotData] = None # Applied on next showEvent
         self.model = PivotTableModel(self)
-        # Connect the model's data_changed signal to the main window's handler if needed
-        # self.model.data_changed.connect(...) # Connect this in main_window after creating the widget
+        self.model.data_changed.connect(self._on_model_data_changed) # main_window connects its own handler too
 
         self._init_ui()
 
@@ -412,10 +426,30 @@ class PivotTableWidget(QWidget):
 
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Apply any pivot data queued while the widget was hidden."""
+        super().showEvent(event)
+        self.apply_pending_updates()
+
+    def queue_pivot_data(self, pivot_data: ExcelPivotData):
+        """Set the pivot data now if visible, otherwise defer it until the widget is shown."""
+        if self.isVisible():
+            self.set_pivot_data(pivot_data)
+        else:
+            self._pending_pivot_data = pivot_data
+            logger.debug("Pivot table hidden, deferring pivot data update until shown.")
+
+    def apply_pending_updates(self):
+        """Set the pivot data queued by queue_pivot_data, if any."""
+        if self._pending_pivot_data is not None:
+            self.set_pivot_data(self._pending_pivot_data)
+
     def set_pivot_data(self, pivot_data: ExcelPivotData):
         """Set the pivot data and update the view and controls"""
+        self._pending_pivot_data = None # Superseded by this update
         self.pivot_data = pivot_data
         self.model.set_pivot_data(pivot_data)
+        self._set_unsaved_changes(False) # Freshly loaded data matches its source
 
         # Update unit combo based on loaded data
         if pivot_data and pivot_data.unit:
@@ -455,9 +489,9 @@ class PivotTableWidget(QWidget):
                  self.rule_prefix_input.setText(f"{RuleType.CLEARANCE.value}_")
 
 
-    # Slot removed, connection should be made in main_window
-    # def _on_model_data_changed(self):
-    #     pass
+    def _on_model_data_changed(self):
+        """Mark the pivot as modified when a cell is edited"""
+        self._set_unsaved_changes(True)
 
     def _generate_rules(self):
         """Generate rules based on the current pivot table data and options"""
@@ -547,6 +581,11 @@ class PivotTableWidget(QWidget):
         Returns True on success, False on failure or cancellation.
         """
         logger.info(f"Exporting pivot data to Excel...")
+        if self.model.rowCount() == 0: # Nothing to export; skip rebuilding the pivot data
+            QMessageBox.warning(self, "Export Error", "No valid pivot data available to export.")
+            logger.warning("Excel export failed: No valid pivot data.")
+            return False
+
         updated_pivot_data = self.model.get_updated_pivot_data()
 
         if updated_pivot_data is None or updated_pivot_data.pivot_df is None:
@@ -573,9 +612,8 @@ class PivotTableWidget(QWidget):
             file_path += '.xlsx'
 
         try:
-            # Use pandas to export the DataFrame
             # Ensure index is included as it's meaningful (Net Classes)
-            updated_pivot_data.pivot_df.to_excel(file_path, index=True)
+            ExcelExporter().export_dataframe(updated_pivot_data.pivot_df, file_path, index=True)
             logger.info(f"Successfully exported pivot data to {file_path}")
             # Show success message only if dialog was used (file_path was initially None)
             # If called programmatically, the caller might show the message.
@@ -592,59 +630,16 @@ class PivotTableWidget(QWidget):
             QMessageBox.critical(self, "Export Error", error_msg)
             return False # Indicate failure
 
-    def has_unsaved_changes(self) -> bool:
-        """Checks if the pivot table data has unsaved changes."""
-        # Basic check: Compare current model data with original loaded data
-        # This is a simplified check. A more robust way would be to track edits via signals.
-        if self.pivot_data is None:
-            return False # No data loaded, so no changes
-
-        # Get current data without reconstructing DataFrame if possible
-        current_values = self.model.data_array
-        current_index = self.model.index_column
-        current_headers = self.model.headers
+    def _set_unsaved_changes(self, changed: bool):
+        """Set the unsaved changes flag and emit a signal if it changed"""
+        if self._unsaved_changes != changed:
+            self._unsaved_changes = changed
+            self.unsaved_changes_changed.emit(changed)
 
-        if current_values is None or current_index is None or current_headers is None:
-             # This case might indicate an issue, log it.
-             logger.warning("Could not retrieve current data parts for unsaved changes check.")
-             return False # Error getting current data parts
-
-        # Compare numpy arrays (handle NaNs correctly)
-        original_values = self.pivot_data.values
-
-        # Ensure original_values is also float for comparison, handle potential errors
-        try:
-            # Make sure original_values is a numpy array first
-            if not isinstance(original_values, np.ndarray):
-                 original_values = np.array(original_values) # Attempt conversion
-            original_values_float = original_values.astype(float)
-        except (ValueError, TypeError, AttributeError) as e:
-             # If original cannot be float, assume change if current is different type/shape
-             logger.warning(f"Original pivot data values could not be cast to float for comparison: {e}. Comparing directly.")
-             # Basic comparison if cast fails
-             if not np.array_equal(original_values, current_values):
-                 logger.debug("Unsaved changes detected: Direct array comparison failed after cast error.")
-                 return True
-             # If direct comparison also passes, proceed to check index/headers
-
-
-        # Check shape first
-        if original_values_float.shape != current_values.shape:
-             logger.debug("Unsaved changes detected: Shape mismatch")
-             return True # Shape mismatch means changes
-
-        # Use numpy.array_equal with equal_nan=True for robust comparison
-        if not np.array_equal(original_values_float, current_values, equal_nan=True):
-             logger.debug("Unsaved changes detected: Data values differ")
-             return True # Data values differ
-
-        # Compare headers and index lists
-        if self.pivot_data.row_index != current_index or \
-           self.pivot_data.column_index != current_headers:
-            logger.debug("Unsaved changes detected: Index or headers differ")
-            return True
-
-        return False # No changes detected
+    def has_unsaved_changes(self) -> bool:
+        """Checks if the pivot table data has been edited since it was loaded."""
+        # Tracked from the model's data_changed signal instead of re-comparing the arrays
+        return self._unsaved_changes
 
     # Add mark_saved if needed, similar to RulesManagerWidget
     # def mark_saved(self):
@@ -8,6 +8,7 @@ Rule Editor Widget
 Widget for viewing, editing, adding, and deleting Altium design rules.
 """
 
+import copy
 import logging
 from typing import Dict, List, Optional, Union, Tuple # Add List
 from PyQt5.QtWidgets import (
@@ -33,6 +34,9 @@ class RulesManagerWidget(QWidget):
     rules_updated = pyqtSignal(list) # Emits the current list of rules when changed
     unsaved_changes_changed = pyqtSignal(bool) # Emits True if there are unsaved changes
 
+    _unsaved_changes = False # Instance flag, see _set_unsaved_changes
+    _rul_content_cache: Optional[str] = None # RUL text of the last export, cleared when the rules change
+
     def __init__(self, parent=None):
         """Initialize rules manager widget"""
         super().__init__(parent)
@@ -51,6 +55,7 @@ class RulesManagerWidget(QWidget):
         # --- Rule View (Using QTreeView for potential hierarchy) ---
         self.rules_list_widget = QListWidget()
         self.rules_list_widget.setAlternatingRowColors(True)
+        self.rules_list_widget.setUniformItemSizes(True) # All rows are single-line text; skip per-item size queries
         self.rules_list_widget.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.rules_list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.rules_list_widget.customContextMenuRequested.connect(self._show_context_menu)
@@ -123,21 +128,27 @@ class RulesManagerWidget(QWidget):
 
     def set_and_load_rules(self, rules: List[BaseRule]):
         """Set the internal rules list and load them into the list widget."""
-        self.rules_list_widget.clear()
-        if rules is not None:
-            logger.info(f"Loading {len(rules)} rules into the editor view.")
-            # Store the actual rule objects, making a copy
-            self._rules = list(rules)
-            for rule in self._rules:
-                item = QListWidgetItem(f"{rule.name} ({rule.rule_type.value})")
-                # Store the rule object with the item for later retrieval
-                item.setData(Qt.UserRole, rule)
-                self.rules_list_widget.addItem(item)
-        else:
-            logger.warning("Received None or empty list, clearing rules view.")
-            self._rules = [] # Ensure _rules is an empty list
+        # Suspend painting so the list repaints once instead of once per added item
+        self.rules_list_widget.setUpdatesEnabled(False)
+        try:
+            self.rules_list_widget.clear()
+            if rules is not None:
+                logger.info(f"Loading {len(rules)} rules into the editor view.")
+                # Store the actual rule objects, making a copy
+                self._rules = list(rules)
+                for rule in self._rules:
+                    item = QListWidgetItem(f"{rule.name} ({rule.rule_type.value})")
+                    # Store the rule object with the item for later retrieval
+                    item.setData(Qt.UserRole, rule)
+                    self.rules_list_widget.addItem(item)
+            else:
+                logger.warning("Received None or empty list, clearing rules view.")
+                self._rules = [] # Ensure _rules is an empty list
+        finally:
+            self.rules_list_widget.setUpdatesEnabled(True)
 
         self._update_rule_details(None) # Clear details view
+        self._rul_content_cache = None # New rule set, the cached export text is stale
         self._set_unsaved_changes(False) # Reset unsaved changes flag after loading
         logger.debug(f"Rules loaded, unsaved changes set to {self._unsaved_changes}")
 
@@ -373,8 +384,12 @@ class RulesManagerWidget(QWidget):
                 for rule in rules_to_export:
                     rule_manager.add_rule(rule) # Add rules to the manager
 
+                # Re-exporting unchanged rules reuses the text generated last time
+                if self._rul_content_cache is None:
+                    self._rul_content_cache = rule_manager.to_rul_format()
+
                 # Use the RuleManager's export method
-                rule_manager.export_rules_to_file(file_path)
+                rule_manager.export_rules_to_file(file_path, self._rul_content_cache)
 
                 logger.info(f"Exported {len(rules_to_export)} rules to {file_path}")
                 # Exporting doesn't necessarily mean changes are 'saved' internally
@@ -394,11 +409,24 @@ class RulesManagerWidget(QWidget):
 
     def _set_unsaved_changes(self, changed: bool):
         """Set the unsaved changes flag and emit signal if state changes."""
+        if changed:
+            self._rul_content_cache = None # Every rule edit passes through here
         if self._unsaved_changes != changed:
             self._unsaved_changes = changed
             self.unsaved_changes_changed.emit(changed)
             logger.debug(f"Unsaved changes status set to: {changed}")
 
+    def get_rule_manager(self) -> RuleManager:
+        """Return a RuleManager holding a snapshot of the current rules, safe to export off the GUI thread."""
+        rule_manager = RuleManager()
+        # Edits assign new attribute values rather than mutating them, so shallow copies are enough
+        rule_manager.rules = [copy.copy(rule) for rule in self._rules]
+        return rule_manager
+
+    def mark_saved(self):
+        """Clear the unsaved changes flag after the rules were written to disk."""
+        self._set_unsaved_changes(False)
+
     def has_unsaved_changes(self) -> bool:
         """Check if there are unsaved changes."""
         # This relies on the _unsaved_changes flag which should be set correctly
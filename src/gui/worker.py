@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Background Worker
+=================
+
+Runs blocking work (file reading, parsing) on the global QThreadPool so the
+GUI thread stays responsive. Results are delivered back through Qt signals.
+"""
+
+import logging
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker. QRunnable is not a QObject, so they live here."""
+
+    finished = pyqtSignal(object) # Emits the return value of the worker function
+    error = pyqtSignal(str) # Emits the error message if the worker function raised
+
+class Worker(QRunnable):
+    """Runs a callable on a thread pool thread.
+
+    The callable must not touch any QWidget; connect to the signals instead and
+    update the UI from the slot, which runs on the GUI thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        """Initialize the worker with the callable and its arguments."""
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Call the function and emit its result or error."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Background task failed: {e}", exc_info=True)
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            # The wrapper can outlive the task; don't let it pin large arguments such as DataFrames
+            self.fn = self.args = self.kwargs = None
@@ -13,6 +13,7 @@ import sys
 import logging
 import os
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 # Add the src directory to the Python path so imports work correctly
@@ -48,6 +49,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Altium Rule Generator")
     app.setOrganizationName("AltiumTools")
+    app.setFont(QFont("Arial", 10)) # Set before any widget exists so nothing has to re-polish
     
     # Load configuration
     config = ConfigManager()
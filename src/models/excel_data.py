@@ -205,21 +205,10 @@ class ExcelPivotData:
                 net_classes.add(rule.target_scope.items[0])
         
         net_classes = sorted(list(net_classes))
+        class_positions = {net_class: i for i, net_class in enumerate(net_classes)}
         
-        # Create empty DataFrame with net classes as rows and columns
-        df = pd.DataFrame(
-            index=net_classes,
-            columns=["NetClass"] + net_classes
-        )
-        
-        # Set row headers
-        df["NetClass"] = net_classes
-        
-        # Fill with NaN initially
-        for col in net_classes:
-            df[col] = np.nan
-        
-        # Fill in clearance values from rules
+        # Fill a NaN matrix with clearance values from rules
+        values = np.full((len(net_classes), len(net_classes)), np.nan)
         for rule in rules:
             if (rule.source_scope.scope_type == "NetClass" and rule.source_scope.items and
                 rule.target_scope.scope_type == "NetClass" and rule.target_scope.items):
@@ -227,8 +216,13 @@ class ExcelPivotData:
                 source_class = rule.source_scope.items[0]
                 target_class = rule.target_scope.items[0]
                 
-                if source_class in net_classes and target_class in net_classes:
-                    df.loc[source_class, target_class] = rule.min_clearance
+                if source_class in class_positions and target_class in class_positions:
+                    values[class_positions[source_class], class_positions[target_class]] = rule.min_clearance
+        
+        # Build the DataFrame in one go, with net classes as rows and columns
+        df = pd.DataFrame(values, index=net_classes, columns=net_classes)
+        # A net class may itself be named "NetClass"; keep its column next to the row headers as before
+        df.insert(0, "NetClass", net_classes, allow_duplicates=True)
         
         # Create ExcelPivotData instance
         pivot_data = ExcelPivotData(RuleType.CLEARANCE)
@@ -243,20 +237,9 @@ class ExcelPivotData:
         
         # If we don't have a pivot_df but have the components, reconstruct it
         if self.row_index is not None and self.column_index is not None and self.values is not None:
-            # Create DataFrame with the right shape
-            df = pd.DataFrame(
-                index=range(len(self.row_index)),
-                columns=["NetClass"] + self.column_index
-            )
-            
-            # Set row headers
-            df["NetClass"] = self.row_index
-            
-            # Set values
-            for row_idx, row_name in enumerate(self.row_index):
-                for col_idx, col_name in enumerate(self.column_index):
-                    df.loc[row_idx, col_name] = self.values[row_idx, col_idx]
-            
+            # Build the DataFrame straight from the values array, then add row headers
+            df = pd.DataFrame(self.values, columns=self.column_index)
+            df.insert(0, "NetClass", self.row_index, allow_duplicates=True) # Column names may include "NetClass"
             return df
         
         logger.error("Cannot convert to DataFrame, missing data")
@@ -12,10 +12,37 @@ import logging
 import re
 import uuid
 from enum import Enum
-from typing import Dict, List, Optional, Union, Tuple, Type, Any
+from typing import Dict, Iterator, List, Optional, Union, Tuple, Type, Any
+
+from utils.atomic_file import atomic_open
+from utils.parse_cache import ParseCache
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing or the rule to_dict format changes so older cache entries are not reused
+RUL_PARSER_VERSION = "1"
+_rul_parse_cache = ParseCache("rul", RUL_PARSER_VERSION)
+
+# Regular expressions used when parsing RUL content, compiled once at import
+_RULE_BLOCK_RE = re.compile(r'Rule\s*{[^}]*}', re.DOTALL)
+_RULE_PROPERTY_RE = re.compile(r'\s+(\w+)\s*=\s*[\'"]?([^\'"\n}]*)[\'"]?\s*')
+_NET_CLASS_RE = re.compile(r'InNetClass\([\'"]([^\'"]*)[\'"]')
+_NET_CLASS_NAME_RE = re.compile(r'^[a-zA-Z0-9_\-]+$')
+_QUOTED_RE = re.compile(r'[\'"]([^\'"]*)[\'"]')
+_RUL_LENGTH_RE = re.compile(r'^\s*([-+]?[\d.]+(?:[eE][-+]?\d+)?)\s*([A-Za-z]*)\s*$')
+
+# Pipe-delimited RUL line keys (Altium's export format, written by to_rul_format) and the
+# property names the rule factories read, which follow the "Rule { ... }" block format
+_RUL_LINE_PROPERTY_NAMES = {
+    "NAME": "Name",
+    "RULEKIND": "RuleKind",
+    "ENABLED": "Enabled",
+    "COMMENT": "Comment",
+    "PRIORITY": "Priority",
+    "SCOPE1EXPRESSION": "SourceScope",
+    "SCOPE2EXPRESSION": "TargetScope",
+}
+
 class UnitType(Enum):
     """Unit types for measurements"""
     MIL = "mil"
@@ -221,7 +248,7 @@ class ClearanceRule(BaseRule):
     @classmethod
     def from_dict(cls, data: Dict) -> 'ClearanceRule':
         """Create from dictionary"""
-        base_rule = super(ClearanceRule, cls).from_dict(data)
+        base_rule = BaseRule.from_dict(data)
         
         return cls(
             name=base_rule.name,
@@ -336,12 +363,25 @@ class UnRoutedNetRule(SingleScopeRule):
         return self._build_rul_line(properties)
 
 
+# Rule classes keyed by type, used to rebuild rules from to_dict output
+_RULE_CLASSES: Dict[RuleType, Type[BaseRule]] = {
+    RuleType.CLEARANCE: ClearanceRule,
+    RuleType.SHORT_CIRCUIT: ShortCircuitRule,
+    RuleType.UNROUTED_NET: UnRoutedNetRule,
+}
+
 class RuleManager:
     """Manages a collection of rules"""
     
     def __init__(self):
         """Initialize rule manager"""
         self.rules = []
+        # Rule factories keyed by the RUL RuleKind, built once rather than per parsed block
+        self._rule_factories = {
+            RuleType.CLEARANCE.value: self._create_clearance_rule,
+            RuleType.SHORT_CIRCUIT.value: self._create_short_circuit_rule,
+            RuleType.UNROUTED_NET.value: self._create_unrouted_net_rule
+        }
     
     def add_rule(self, rule: BaseRule):
         """Add a rule to the collection"""
@@ -379,15 +419,28 @@ class RuleManager:
     
     def to_rul_format(self) -> str:
         """Convert all rules to RUL file format (pipe-delimited lines)"""
-        rul_lines = [rule.to_rul_format() for rule in self.rules]
-        return "\r\n".join(rul_lines)
-    
-    def export_rules_to_file(self, file_path: str):
-        """Export all rules to a .RUL file."""
+        return "".join(self.iter_rul_format())
+
+    def iter_rul_format(self) -> Iterator[str]:
+        """Yield the RUL file content piece by piece, as joined by to_rul_format"""
+        for index, rule in enumerate(self.rules):
+            if index:
+                yield "\r\n"
+            yield rule.to_rul_format()
+    
+    def export_rules_to_file(self, file_path: str, rul_content: Optional[str] = None):
+        """Export all rules to a .RUL file.
+
+        Args:
+            file_path (str): Destination .RUL path.
+            rul_content (str, optional): Output of to_rul_format for these rules, if the caller has it cached.
+        """
         try:
-            rul_content = self.to_rul_format()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(rul_content)
+            with atomic_open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                if rul_content is None:
+                    f.writelines(self.iter_rul_format()) # Stream rule by rule instead of building the whole file
+                else:
+                    f.write(rul_content)
             logger.info(f"Successfully exported {len(self.rules)} rules to {file_path}")
         except IOError as e:
             logger.error(f"Error writing RUL file to {file_path}: {e}", exc_info=True)
@@ -406,6 +459,11 @@ class RuleManager:
         try:
             self.rules = []
             rule_blocks = self._extract_rule_blocks(rul_content)
+            parse_rule = self._parse_rule_block
+            if not rule_blocks:
+                # Altium exports, and files written by to_rul_format, hold one pipe-delimited rule per line
+                rule_blocks = [line for line in rul_content.splitlines() if '=' in line]
+                parse_rule = self._parse_rul_line
             
             if not rule_blocks:
                 logger.error("No rule blocks found in RUL content.")
@@ -415,7 +473,7 @@ class RuleManager:
             
             successful_rules = 0
             for block in rule_blocks:
-                rule = self._parse_rule_block(block)
+                rule = parse_rule(block)
                 if rule:
                     self.add_rule(rule)
                     successful_rules += 1
@@ -431,28 +489,50 @@ class RuleManager:
             logger.error(f"Error parsing RUL content: {str(e)}")
             return False
     
+    def import_from_rul(self, file_path: str) -> bool:
+        """Load rules from a RUL file, reusing the cached parse if the file is unchanged."""
+        with open(file_path, 'rb') as f:
+            raw_content = f.read()
+
+        cache_key = _rul_parse_cache.key_for(raw_content)
+        cached_rules = _rul_parse_cache.load(cache_key)
+        if cached_rules is not None:
+            # Entries hold plain to_dict data, so they do not depend on the rule classes' pickled layout
+            try:
+                self.from_dict(cached_rules)
+                logger.info(f"Loaded {len(self.rules)} rules for {file_path} from the parse cache")
+                return True
+            except Exception as e:
+                logger.warning(f"Ignoring unusable parse cache entry for {file_path}: {e}")
+
+        if not self.from_rul_content(raw_content.decode('utf-8', errors='replace')):
+            return False # Failed or empty parses are not cached, so a later parser can retry them
+        _rul_parse_cache.store(cache_key, self.to_dict())
+        return True
+
     def _extract_rule_blocks(self, rul_content: str) -> List[str]:
         """Extract rule blocks from RUL content"""
-        pattern = r'Rule\s*{[^}]*}'
-        return re.findall(pattern, rul_content, re.DOTALL)
+        return _RULE_BLOCK_RE.findall(rul_content)
     
     def _parse_rule_block(self, block: str) -> Optional[BaseRule]:
         """Parse a rule block into a rule object"""
+        return self._create_rule(self._extract_rule_properties(block))
+    
+    def _parse_rul_line(self, line: str) -> Optional[BaseRule]:
+        """Parse a pipe-delimited RUL line into a rule object"""
+        return self._create_rule(self._extract_rul_line_properties(line))
+    
+    def _create_rule(self, properties: Dict[str, str]) -> Optional[BaseRule]:
+        """Create a rule object from its parsed properties"""
         try:
-            properties = self._extract_rule_properties(block)
             if not properties.get('Name') or not properties.get('RuleKind'):
                 logger.warning("Rule block missing required properties (Name or RuleKind)")
                 return None
             
-            rule_factories = {
-                RuleType.CLEARANCE.value: self._create_clearance_rule,
-                RuleType.SHORT_CIRCUIT.value: self._create_short_circuit_rule,
-                RuleType.UNROUTED_NET.value: self._create_unrouted_net_rule
-            }
-            
             rule_kind = properties.get('RuleKind')
-            if rule_kind in rule_factories:
-                return rule_factories[rule_kind](properties)
+            factory = self._rule_factories.get(rule_kind)
+            if factory is not None:
+                return factory(properties)
             
             logger.warning(f"Unsupported rule kind: {rule_kind}")
             return None
@@ -464,15 +544,29 @@ class RuleManager:
     def _extract_rule_properties(self, block: str) -> Dict[str, str]:
         """Extract all properties from a rule block"""
         properties = {}
-        # Extract property pattern
-        property_pattern = r'\s+(\w+)\s*=\s*[\'"]?([^\'"\n}]*)[\'"]?\s*'
-        
-        for match in re.finditer(property_pattern, block):
+        for match in _RULE_PROPERTY_RE.finditer(block):
             key, value = match.groups()
             properties[key] = value.strip()
         
         return properties
     
+    def _extract_rul_line_properties(self, line: str) -> Dict[str, str]:
+        """Extract the properties of a pipe-delimited RUL line under the rule block property names"""
+        line_properties = dict(part.split('=', 1) for part in line.strip().split('|') if '=' in part)
+        properties = {name: line_properties[key].strip()
+                      for key, name in _RUL_LINE_PROPERTY_NAMES.items() if key in line_properties}
+        if 'SourceScope' in properties:
+            properties['Scope'] = properties['SourceScope'] # Single-scope rules keep theirs in SCOPE1EXPRESSION
+        
+        # GAP holds the clearance with its unit appended, e.g. 0.295mm
+        gap_match = _RUL_LENGTH_RE.match(line_properties.get('GAP', ''))
+        if gap_match:
+            properties['MinimumClearance'], unit_str = gap_match.groups()
+            if unit_str:
+                properties['MinimumClearanceType'] = unit_str
+        
+        return properties
+    
     def _create_clearance_rule(self, properties: Dict[str, str]) -> Optional[ClearanceRule]:
         """Create a clearance rule from properties"""
         try:
@@ -561,21 +655,21 @@ class RuleManager:
         if not scope_str or scope_str.strip().lower() == 'all':
             return RuleScope("All")
         
+        # Check for multiple net classes (OR pattern) first, since each term also matches InNetClass
+        if ' OR ' in scope_str:
+            class_matches = _NET_CLASS_RE.findall(scope_str)
+            if class_matches:
+                return RuleScope("NetClasses", class_matches)
+        
         # Check for InNetClass pattern
-        net_class_match = re.search(r'InNetClass\([\'"]([^\'"]*)[\'"]', scope_str)
+        net_class_match = _NET_CLASS_RE.search(scope_str)
         if net_class_match:
             net_class_name = net_class_match.group(1).strip()
-            if net_class_name and re.match(r'^[a-zA-Z0-9_\-]+$', net_class_name):
+            if net_class_name and _NET_CLASS_NAME_RE.match(net_class_name):
                 return RuleScope("NetClass", [net_class_name])
         
-        # Check for multiple net classes (OR pattern)
-        if ' OR ' in scope_str:
-            class_matches = re.findall(r'InNetClass\([\'"]([^\'"]*)[\'"]', scope_str)
-            if class_matches:
-                return RuleScope("NetClasses", class_matches)
-        
         # Check for quoted custom scope
-        quoted_match = re.search(r'[\'"]([^\'"]*)[\'"]', scope_str)
+        quoted_match = _QUOTED_RE.search(scope_str)
         if quoted_match:
             return RuleScope("Custom", [quoted_match.group(1)])
         
@@ -585,3 +679,7 @@ class RuleManager:
     def to_dict(self) -> List[Dict]:
         """Convert all rules to dictionary format"""
         return [rule.to_dict() for rule in self.rules]
+
+    def from_dict(self, data: List[Dict]):
+        """Replace the rules with ones rebuilt from to_dict output"""
+        self.rules = [_RULE_CLASSES[RuleType(rule_data["rule_type"])].from_dict(rule_data) for rule_data in data]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Excel Exporter Service
+=====================
+
+Service for writing pivot table DataFrames to Excel files.
+"""
+
+import logging
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
+def _get_xlsxwriter():
+    """Import xlsxwriter on first export, or return None if it is not installed"""
+    # Writer libraries are imported here rather than at module level to keep them off the startup path
+    try:
+        import xlsxwriter
+    except ImportError: # Optional dependency, openpyxl is used instead
+        from openpyxl.xml import LXML
+        if not LXML:
+            logger.warning("Neither xlsxwriter nor lxml is installed; Excel export will use openpyxl's slower pure-Python XML writer.")
+        return None
+    return xlsxwriter
+
+class ExcelExportError(Exception):
+    """Exception raised for errors during Excel export"""
+    pass
+
+class ExcelExporter:
+    """Service for exporting DataFrames to Excel files"""
+
+    def export_dataframe(self, df: pd.DataFrame, file_path: str, index: bool = True):
+        """Write a DataFrame to a single-sheet .xlsx file with xlsxwriter, or openpyxl if it is missing
+
+        Args:
+            df (pd.DataFrame): Data to write.
+            file_path (str): Destination .xlsx path.
+            index (bool): Write the row index as the first column, like DataFrame.to_excel.
+        """
+        try:
+            headers, values = self._prepare_rows(df, index)
+            if _get_xlsxwriter() is not None:
+                self._write_xlsxwriter(headers, values, file_path)
+            else:
+                self._write_openpyxl(headers, values, file_path)
+            logger.info(f"Exported {df.shape[0]}x{df.shape[1]} DataFrame to Excel file: {file_path}")
+        except Exception as e:
+            error_msg = f"Error exporting Excel file: {str(e)}"
+            logger.error(error_msg)
+            raise ExcelExportError(error_msg)
+
+    def _prepare_rows(self, df: pd.DataFrame, index: bool):
+        """Return the header row and an object array of cell values laid out like DataFrame.to_excel"""
+        headers = ([df.index.name or ""] if index else []) + list(df.columns)
+        values = df.to_numpy(dtype=object, copy=not index) # column_stack copies when there is an index; without one, pandas may return a read-only view
+        if index:
+            values = np.column_stack([df.index.to_numpy(dtype=object), values])
+        # Sanitize the whole block up front; both writers reject NaN/inf cells
+        values[pd.isna(values)] = None # Missing values become blank cells, as with to_excel
+        values[values == np.inf] = "inf" # Infinities are written as text, like to_excel's inf_rep
+        values[values == -np.inf] = "-inf"
+        return headers, values
+
+    def _write_xlsxwriter(self, headers: list, values: np.ndarray, file_path: str):
+        """Write the rows with xlsxwriter directly, bypassing pandas' per-cell formatter"""
+        # constant_memory flushes each row to disk once the next one starts, so rows must be written in order
+        workbook = _get_xlsxwriter().Workbook(file_path, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, headers)
+            for row_num, row in enumerate(values.tolist(), start=1):
+                worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+
+    def _write_openpyxl(self, headers: list, values: np.ndarray, file_path: str):
+        """Write the rows with an openpyxl write-only workbook, which streams instead of building cell objects"""
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Sheet1")
+        worksheet.append(headers)
+        for row in values.tolist():
+            worksheet.append(row)
+        workbook.save(file_path)
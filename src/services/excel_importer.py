@@ -33,28 +33,6 @@ class ExcelImporter:
         self.last_sheet_name = None
         self.detected_unit = UnitType.MIL
     
-    def get_sheet_names(self, file_path: str) -> List[str]:
-        """Get the sheet names from an Excel file"""
-        try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                raise ExcelImportError(f"File not found: {file_path}")
-            
-            # Read Excel file
-            xls = pd.ExcelFile(file_path)
-            sheet_names = xls.sheet_names
-            
-            if not sheet_names:
-                raise ExcelImportError(f"No sheets found in Excel file: {file_path}")
-            
-            logger.info(f"Found {len(sheet_names)} sheets in Excel file: {file_path}")
-            return sheet_names
-            
-        except Exception as e:
-            error_msg = f"Error getting sheet names from Excel file: {str(e)}"
-            logger.error(error_msg)
-            raise ExcelImportError(error_msg)
-            
     def import_file(self, file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
         """Import Excel file and return as DataFrame"""
         try:
@@ -3,12 +3,55 @@
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
 import uuid # Import uuid for generating unique IDs
 
 from models.rule_model import RuleManager
 
+if TYPE_CHECKING:
+    import pandas as pd # Only needed for generate_from_dataframe's annotation
+
+# RUL line fields in output order (order matters for comparison with sample); {name} placeholders are per rule
+_RUL_COMMON_FIELDS = (
+    ("SELECTION", "FALSE"),
+    ("LAYER", "{layer}"),
+    ("LOCKED", "FALSE"),
+    ("POLYGONOUTLINE", "FALSE"),
+    ("USERROUTED", "TRUE"),
+    ("KEEPOUT", "FALSE"),
+    ("UNIONINDEX", "0"),
+    ("RULEKIND", "{rule_kind}"),
+    ("NETSCOPE", "{net_scope}"),
+    ("LAYERKIND", "{layer_kind}"),
+    ("SCOPE1EXPRESSION", "{scope1_expr}"),
+    ("SCOPE2EXPRESSION", "{scope2_expr}"),
+    ("NAME", "{name}"),
+    ("ENABLED", "{enabled}"),
+    ("PRIORITY", "{priority}"),
+    ("COMMENT", "{comment}"),
+    ("UNIQUEID", "{unique_id}"),
+    ("DEFINEDBYLOGICALDOCUMENT", "FALSE"),
+)
+# RuleKind specific fields, appended after the common ones
+_RUL_KIND_FIELDS = {
+    "Clearance": (
+        ("GAP", "{value}"),
+        ("GENERICCLEARANCE", "{value}"),
+        ("IGNOREPADTOPADCLEARANCEINFOOTPRINT", "{ignore_pad_clearance}"),
+        ("OBJECTCLEARANCES", " "), # Default empty, complex structure
+    ),
+    # Add other RuleKind specific fields here if needed, e.g. "Width": MINLIMIT/MAXLIMIT/PREFEREDWIDTH
+}
+
+def _build_rul_line_template(fields) -> str:
+    """Join RUL fields into a str.format template for one newline-terminated rule line."""
+    return "|".join(f"{key}={value}" for key, value in fields) + "\n"
+
+# Built once at import so each rule line is a single str.format call
+_RUL_LINE_TEMPLATE = _build_rul_line_template(_RUL_COMMON_FIELDS)
+_RUL_LINE_TEMPLATES = {kind: _build_rul_line_template(_RUL_COMMON_FIELDS + fields)
+                       for kind, fields in _RUL_KIND_FIELDS.items()}
+
 class RuleGeneratorError(Exception):
     """Custom exception class for RuleGenerator errors."""
 
@@ -76,8 +119,23 @@ class RuleGenerator:
 
     def generate_rul_content(self, rules_data: List[Dict[str, Any]]) -> str:
         """
-        Generates the content for the .RUL file based on the provided rules data,
-        matching the single-line pipe-delimited format.
+        Generates the content for the .RUL file as a single string.
+        See iter_rul_lines for the expected rule keys.
+
+        Args:
+            rules_data (List[Dict[str, Any]]): A list of dictionaries, each representing a rule.
+
+        Returns:
+            str: The generated content for the .RUL file.
+        """
+        # With no rule lines the content is still a single newline, as it always has been
+        return "".join(self.iter_rul_lines(rules_data)) or "\n"
+
+    def iter_rul_lines(self, rules_data: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Yields the .RUL file content one newline-terminated rule line at a time,
+        matching the single-line pipe-delimited format. Lets callers write rules
+        straight to a file without building the whole content in memory.
 
         Args:
             rules_data (List[Dict[str, Any]]): A list of dictionaries, each representing a rule.
@@ -87,10 +145,9 @@ class RuleGenerator:
                                                 'Value', 'Unit', 'Comment', 'RuleKind',
                                                 'NetScope', 'LayerKind'.
 
-        Returns:
-            str: The generated content for the .RUL file.
+        Yields:
+            str: One rule line, including its trailing newline.
         """
-        rul_lines = []
         # No header needed based on the sample
 
         for i, rule in enumerate(rules_data):
@@ -126,51 +183,18 @@ class RuleGenerator:
                 # --- Generate Unique ID (using 8 random hex chars, closer to sample) ---
                 unique_id = uuid.uuid4().hex[:8].upper()
 
-                # --- Construct Rule Dictionary (Order matters for comparison with sample) ---
-                rule_dict = {
-                    "SELECTION": "FALSE",
-                    "LAYER": layer,
-                    "LOCKED": "FALSE",
-                    "POLYGONOUTLINE": "FALSE",
-                    "USERROUTED": "TRUE",
-                    "KEEPOUT": "FALSE",
-                    "UNIONINDEX": 0,
-                    "RULEKIND": rule_kind,
-                    "NETSCOPE": net_scope,
-                    "LAYERKIND": layer_kind,
-                    "SCOPE1EXPRESSION": scope1_expr,
-                    "SCOPE2EXPRESSION": scope2_expr,
-                    "NAME": name,
-                    "ENABLED": enabled_str,
-                    "PRIORITY": priority,
-                    "COMMENT": comment_str,
-                    "UNIQUEID": unique_id,
-                    "DEFINEDBYLOGICALDOCUMENT": "FALSE",
-                }
-
-                # Add RuleKind specific fields
-                if rule_kind == 'Clearance':
-                    rule_dict["GAP"] = f"{value_str}{unit}"
-                    rule_dict["GENERICCLEARANCE"] = f"{value_str}{unit}"
-                    rule_dict["IGNOREPADTOPADCLEARANCEINFOOTPRINT"] = ignore_pad_clearance_str
-                    rule_dict["OBJECTCLEARANCES"] = " " # Default empty, complex structure
-                # Add other RuleKind specific fields here if needed
-                # elif rule_kind == 'Width':
-                #     rule_dict["MINLIMIT"] = f"{value_str}{unit}"
-                #     rule_dict["MAXLIMIT"] = f"{value_str}{unit}" # Example
-                #     rule_dict["PREFEREDWIDTH"] = f"{value_str}{unit}" # Example
-
-                # --- Format as Single Line ---
-                rule_line = "|".join([f"{k}={v}" for k, v in rule_dict.items()])
-                rul_lines.append(rule_line)
+                # --- Format as Single Line from the RuleKind's prebuilt template ---
+                template = _RUL_LINE_TEMPLATES.get(rule_kind, _RUL_LINE_TEMPLATE)
+                yield template.format(
+                    layer=layer, rule_kind=rule_kind, net_scope=net_scope, layer_kind=layer_kind,
+                    scope1_expr=scope1_expr, scope2_expr=scope2_expr, name=name, enabled=enabled_str,
+                    priority=priority, comment=comment_str, unique_id=unique_id,
+                    value=f"{value_str}{unit}", ignore_pad_clearance=ignore_pad_clearance_str)
 
             except Exception as e:
                 logging.error(f"Error processing rule '{rule.get('Name', 'N/A')}': {e}", exc_info=True)
                 # Optionally skip the rule or add a placeholder comment
 
-        # Join lines with newline
-        return "\n".join(rul_lines) + "\n" # Add trailing newline
-
 
     def generate_and_save_rul(self, output_path: str, rules_data: Optional[List[Dict[str, Any]]] = None):
         """
@@ -188,21 +212,20 @@ class RuleGenerator:
             logging.warning("No rules data provided or found in the model. Cannot generate RUL file.")
             return
 
-        rul_content = self.generate_rul_content(rules_data)
-
         try:
             # Ensure we write with an encoding that supports potential special characters
             # Use 'utf-8' and let Python handle line endings based on OS ('\n')
             # Altium likely handles standard \n line endings correctly.
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(rul_content)
+            # Rules are streamed through a 1 MiB buffer instead of being joined first
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(self.iter_rul_lines(rules_data))
 
             logging.info(f"Successfully generated and saved RUL file to: {output_path}")
         except IOError as e:
             logging.error(f"Error saving RUL file to {output_path}: {e}")
             raise # Re-raise the exception for the caller to handle
 
-    def generate_from_dataframe(self, df: pd.DataFrame) -> str:
+    def generate_from_dataframe(self, df: 'pd.DataFrame') -> str:
          """
          Generates RUL content directly from a pandas DataFrame.
 
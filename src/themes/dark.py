@@ -11,7 +11,7 @@ class DarkTheme:
         self.font_family = "Arial"
         self.font_size = 10
 
-    def apply(self, app):
+    def apply(self, app, base_stylesheet=""):
         app.setStyle("Fusion")
         palette = QPalette() # Create a new palette
         # Use QColor to set colors
@@ -38,7 +38,7 @@ class DarkTheme:
 
         app.setPalette(palette)
         # Apply minimal stylesheet for things not easily covered by palette (like borders)
-        app.setStyleSheet(f"""
+        app.setStyleSheet(base_stylesheet + f"""
             QGroupBox {{ 
                 border: 1px solid {self.border_color}; 
                 margin-top: 0.5em; 
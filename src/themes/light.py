@@ -13,7 +13,7 @@ class LightTheme:
         self.disabled_button_text_color = "#707070"
         self.disabled_highlight_color = "#D0D0D0"
 
-    def apply(self, app):
+    def apply(self, app, base_stylesheet=""):
         app.setStyle("Fusion") # Use Fusion style for consistency
         palette = QPalette()
 
@@ -42,7 +42,7 @@ class LightTheme:
         app.setPalette(palette)
 
         # Apply minimal stylesheet for things not easily covered by palette (like borders)
-        app.setStyleSheet(f"""
+        app.setStyleSheet(base_stylesheet + f"""
             QGroupBox {{ 
                 border: 1px solid {self.border_color}; 
                 margin-top: 0.5em; 
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import logging
 from pathlib import Path
 from PyQt5.QtWidgets import QApplication
@@ -13,6 +14,9 @@ from .light import LightTheme # Import theme class
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 STYLES_DIR = os.path.join(BASE_DIR, '..', 'styles')
+# PyInstaller builds unpack the bundled resources (see main.spec) under sys._MEIPASS
+RESOURCES_DIR = Path(getattr(sys, '_MEIPASS', BASE_DIR.parent)) / 'resources'
+BASE_STYLESHEET_PATH = RESOURCES_DIR / 'style.qss'
 
 class ThemeManager:
     """Manages application themes."""
@@ -30,6 +34,10 @@ class ThemeManager:
             "light": LightTheme(),
             "dark": DarkTheme(),
         }
+        # The theme set is fixed after construction, so list it once
+        self._available_themes = tuple(self.THEMES)
+        # Read once; every theme prepends it to the application stylesheet it sets
+        self._base_stylesheet = self._load_base_stylesheet()
         self.current_theme_name = config_manager.get("theme", "dark") # Default to dark theme
         self.apply_theme(self.current_theme_name)
 
@@ -47,7 +55,7 @@ class ThemeManager:
         theme_instance = self.THEMES.get(theme_name)
 
         if theme_instance:
-            theme_instance.apply(self.app) # Call the theme's apply method
+            theme_instance.apply(self.app, self._base_stylesheet) # Call the theme's apply method
             self.current_theme_name = theme_name
             config_manager.set("theme", theme_name) # Save the selected theme
             logging.info(f"Applied theme: {theme_name}")
@@ -55,6 +63,20 @@ class ThemeManager:
             # This case should ideally not happen if fallback works
             logging.error(f"Failed to get theme instance for: {theme_name}")
 
+    @staticmethod
+    def _load_base_stylesheet() -> str:
+        """
+        Reads the base stylesheet shared by all themes.
+
+        Returns:
+            str: The stylesheet text, or an empty string if it cannot be read.
+        """
+        try:
+            return BASE_STYLESHEET_PATH.read_text(encoding='utf-8')
+        except OSError as e:
+            logging.warning(f"Could not read base stylesheet {BASE_STYLESHEET_PATH}: {e}")
+            return ""
+
     def get_current_theme(self) -> str:
         """
         Returns the name of the currently applied theme.
@@ -64,11 +86,11 @@ class ThemeManager:
         """
         return self.current_theme_name
 
-    def get_available_themes(self) -> list:
+    def get_available_themes(self) -> tuple:
         """
-        Returns a list of available theme names.
+        Returns the available theme names.
 
         Returns:
-            list: A list of strings representing the available theme names.
+            tuple: Strings representing the available theme names.
         """
-        return list(self.THEMES.keys())
+        return self._available_themes
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Atomic File Writes
+==================
+
+Writes go to a temporary file next to the destination, which replaces the
+destination only once the write has completed. An interrupted export then
+leaves the previous file intact instead of a truncated one.
+"""
+
+import os
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_open(file_path, mode: str = 'wb', **open_kwargs):
+    """Open a temporary '<file_path>.part' for writing and move it over file_path on success.
+
+    Args:
+        file_path: Destination path.
+        mode (str): Write mode passed to open, e.g. 'wb' or 'w'.
+        **open_kwargs: Further open arguments such as encoding or buffering.
+    """
+    file_path = os.fspath(file_path)
+    part_path = f"{file_path}.part"
+    try:
+        with open(part_path, mode, **open_kwargs) as f:
+            yield f
+        os.replace(part_path, file_path) # Atomic on POSIX and Windows
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass # Never created, or already gone
+        raise
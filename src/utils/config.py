@@ -18,6 +18,7 @@ class ConfigManager:
         "last_export_dir": str(Path.home()),
         "last_import_dir": str(Path.home()),
         "auto_load_last_file": False,
+        "show_success_popups": False, # Successful imports/exports are reported in the status bar only
         "last_opened_file": None,
         "default_rule_name": "GeneratedRule",
         "default_rule_priority": 1,
@@ -68,6 +69,11 @@ class ConfigManager:
         self.config[key] = value
         self._save_config()
 
+    def update(self, values):
+        """Sets several configuration values and saves the configuration once."""
+        self.config.update(values)
+        self._save_config()
+
     def add_recent_file(self, file_path):
         """Adds a file path to the list of recent files."""
         recent_files = self.get("recent_files", [])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parse Cache
+===========
+
+On-disk cache of parse results, keyed by the SHA-256 of the source bytes and
+a parser version string so that a changed file or parser misses the cache.
+Each cache keeps its most recently used entries and evicts the rest.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import pickletools
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class ParseCache:
+    """Stores pickled parse results under the application's config directory."""
+
+    def __init__(self, name: str, parser_version: str, max_entries: int = 50):
+        """Initializes the cache in ~/.AltiumXCEL2QueryBuilder/cache/<name>, holding at most max_entries results."""
+        self.cache_dir = Path.home() / ".AltiumXCEL2QueryBuilder" / "cache" / name
+        self.parser_version = parser_version
+        self.max_entries = max_entries
+
+    def key_for(self, data: bytes) -> str:
+        """Returns the cache key for the given source bytes."""
+        return f"{hashlib.sha256(data).hexdigest()}_{self.parser_version}"
+
+    def load(self, key: str) -> Optional[Any]:
+        """Returns the cached result for key, or None on a miss or unreadable entry."""
+        cache_path = self.cache_dir / f"{key}.pkl"
+        try:
+            with open(cache_path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(cache_path) # The modification time orders entries for eviction
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {cache_path}: {e}")
+            return None
+
+    def store(self, key: str, value: Any):
+        """Saves a result under key. Failures are logged and otherwise ignored."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data = pickletools.optimize(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            (self.cache_dir / f"{key}.pkl").write_bytes(data)
+            self._evict()
+        except Exception as e:
+            logger.warning(f"Could not write parse cache entry {key}: {e}")
+
+    def _evict(self):
+        """Deletes the least recently used entries beyond max_entries."""
+        entries = sorted(self.cache_dir.glob("*.pkl"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for stale_path in entries[self.max_entries:]:
+            stale_path.unlink(missing_ok=True)
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Test Configuration
+==================
+
+Makes the packages under src importable the same way main.py does.
+"""
+
+import os
+import sys
+
+# Add the src directory to the Python path so imports work correctly
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, src_dir)
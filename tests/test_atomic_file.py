@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Atomic File Tests
+=================
+
+Tests for utils.atomic_file.atomic_open.
+"""
+
+import pytest
+
+from utils.atomic_file import atomic_open
+
+def test_atomic_open_replaces_destination(tmp_path):
+    file_path = tmp_path / "rules.RUL"
+    file_path.write_bytes(b"old")
+    with atomic_open(file_path, 'wb') as f:
+        f.write(b"new")
+    assert file_path.read_bytes() == b"new"
+    assert not (tmp_path / "rules.RUL.part").exists()
+
+def test_atomic_open_passes_open_arguments(tmp_path):
+    file_path = tmp_path / "rules.RUL"
+    with atomic_open(str(file_path), 'w', encoding='utf-8', newline='') as f:
+        f.write("a\r\nb")
+    assert file_path.read_bytes() == b"a\r\nb"
+
+def test_atomic_open_keeps_destination_when_write_fails(tmp_path):
+    file_path = tmp_path / "rules.RUL"
+    file_path.write_bytes(b"old")
+    with pytest.raises(RuntimeError, match="disk full"):
+        with atomic_open(file_path, 'wb') as f:
+            f.write(b"partial")
+            raise RuntimeError("disk full")
+    assert file_path.read_bytes() == b"old"
+    assert not (tmp_path / "rules.RUL.part").exists()
+
+def test_atomic_open_cleans_up_on_interrupt(tmp_path):
+    file_path = tmp_path / "rules.RUL"
+    with pytest.raises(KeyboardInterrupt):
+        with atomic_open(file_path, 'wb') as f:
+            f.write(b"partial")
+            raise KeyboardInterrupt
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Excel Exporter Tests
+====================
+
+Tests for writing pivot DataFrames with xlsxwriter and the openpyxl fallback.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from services import excel_exporter
+from services.excel_exporter import ExcelExporter, ExcelExportError
+
+@pytest.fixture
+def pivot_df():
+    """Small pivot with a missing value and both infinities."""
+    return pd.DataFrame({"A": [1.0, np.nan], "B": [np.inf, -np.inf]},
+                        index=pd.Index(["A", "B"], name="NetClass"))
+
+@pytest.fixture(params=["xlsxwriter", "openpyxl"])
+def writer(request, monkeypatch):
+    """Run a test once per Excel writer backend."""
+    if request.param == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    else:
+        monkeypatch.setattr(excel_exporter, "_get_xlsxwriter", lambda: None) # As if xlsxwriter were not installed
+    return request.param
+
+def read_rows(file_path):
+    """Return the cell values of the first sheet, row by row."""
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        return [list(row) for row in workbook.worksheets[0].iter_rows(values_only=True)]
+    finally:
+        workbook.close()
+
+def test_prepare_rows_blanks_nan_and_writes_inf_as_text(pivot_df):
+    headers, values = ExcelExporter()._prepare_rows(pivot_df, index=True)
+    assert headers == ["NetClass", "A", "B"]
+    assert values.tolist() == [["A", 1.0, "inf"], ["B", None, "-inf"]]
+
+def test_prepare_rows_without_index(pivot_df):
+    headers, values = ExcelExporter()._prepare_rows(pivot_df, index=False)
+    assert headers == ["A", "B"]
+    assert values.tolist() == [[1.0, "inf"], [None, "-inf"]]
+
+def test_export_dataframe_writes_sanitized_rows(tmp_path, pivot_df, writer):
+    file_path = tmp_path / "pivot.xlsx"
+    ExcelExporter().export_dataframe(pivot_df, str(file_path))
+    assert read_rows(file_path) == [["NetClass", "A", "B"], ["A", 1, "inf"], ["B", None, "-inf"]]
+
+def test_export_dataframe_wraps_write_errors(tmp_path, pivot_df):
+    with pytest.raises(ExcelExportError):
+        ExcelExporter().export_dataframe(pivot_df, str(tmp_path / "missing" / "pivot.xlsx"))
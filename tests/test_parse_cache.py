@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parse Cache Tests
+=================
+
+Tests for utils.parse_cache.ParseCache and the cached RUL import in RuleManager.
+"""
+
+import os
+
+import pytest
+
+from models import rule_model
+from models.rule_model import ClearanceRule, RuleManager, RuleScope
+from utils.parse_cache import ParseCache
+
+def write_rul_file(file_path):
+    """Write one clearance rule to file_path the way the app exports it."""
+    rule_manager = RuleManager()
+    rule_manager.add_rule(ClearanceRule("A_B", min_clearance=12.5, source_scope=RuleScope("NetClass", ["A"]),
+                                        target_scope=RuleScope("NetClass", ["B"])))
+    file_path.write_text(rule_manager.to_rul_format(), encoding="utf-8")
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point Path.home() at a temporary directory so caches never touch the real one."""
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    return tmp_path
+
+def test_store_and_load_round_trip(home):
+    cache = ParseCache("test", "1")
+    key = cache.key_for(b"source")
+    cache.store(key, [{"name": "A_B"}])
+    assert cache.cache_dir == home / ".AltiumXCEL2QueryBuilder" / "cache" / "test"
+    assert cache.load(key) == [{"name": "A_B"}]
+
+def test_load_misses_unknown_key(home):
+    cache = ParseCache("test", "1")
+    assert cache.load(cache.key_for(b"never stored")) is None
+
+def test_parser_version_change_invalidates_entries(home):
+    old_cache = ParseCache("test", "1")
+    old_cache.store(old_cache.key_for(b"source"), ["old parse"])
+    new_cache = ParseCache("test", "2")
+    assert new_cache.key_for(b"source") != old_cache.key_for(b"source")
+    assert new_cache.load(new_cache.key_for(b"source")) is None
+
+def test_unreadable_entry_is_a_miss(home):
+    cache = ParseCache("test", "1")
+    key = cache.key_for(b"source")
+    cache.cache_dir.mkdir(parents=True)
+    (cache.cache_dir / f"{key}.pkl").write_bytes(b"not a pickle")
+    assert cache.load(key) is None
+
+def test_store_evicts_least_recently_used_entries(home):
+    cache = ParseCache("test", "1", max_entries=2)
+    keys = [cache.key_for(data) for data in (b"first", b"second", b"third")]
+    cache.store(keys[0], 0)
+    cache.store(keys[1], 1)
+    # Explicit modification times, since stores within one clock tick can share one
+    os.utime(cache.cache_dir / f"{keys[0]}.pkl", (1000, 1000))
+    os.utime(cache.cache_dir / f"{keys[1]}.pkl", (2000, 2000))
+    assert cache.load(keys[0]) == 0 # A hit makes the first entry the most recently used
+    cache.store(keys[2], 2)
+    assert cache.load(keys[1]) is None
+    assert cache.load(keys[0]) == 0
+    assert cache.load(keys[2]) == 2
+
+@pytest.fixture
+def rul_cache(tmp_path, monkeypatch):
+    """Give RuleManager.import_from_rul a cache under tmp_path."""
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    cache = ParseCache("rul", rule_model.RUL_PARSER_VERSION)
+    monkeypatch.setattr(rule_model, "_rul_parse_cache", cache)
+    return cache
+
+def test_import_from_rul_reuses_cached_parse(tmp_path, rul_cache, monkeypatch):
+    rul_path = tmp_path / "rules.RUL"
+    write_rul_file(rul_path)
+    assert RuleManager().import_from_rul(str(rul_path))
+    assert len(list(rul_cache.cache_dir.glob("*.pkl"))) == 1
+
+    def fail_parse(self, rul_content):
+        raise AssertionError("cached file was parsed again")
+    monkeypatch.setattr(RuleManager, "from_rul_content", fail_parse)
+    rule_manager = RuleManager()
+    assert rule_manager.import_from_rul(str(rul_path))
+    assert [(rule.name, rule.min_clearance) for rule in rule_manager.rules] == [("A_B", 12.5)]
+
+def test_import_from_rul_does_not_cache_failed_parse(tmp_path, rul_cache):
+    rul_path = tmp_path / "empty.RUL"
+    rul_path.write_text("not a rule file", encoding="utf-8")
+    assert not RuleManager().import_from_rul(str(rul_path))
+    assert not rul_cache.cache_dir.exists() or not list(rul_cache.cache_dir.glob("*.pkl"))